@@ -858,6 +858,10 @@ class BaseModel(NN):
 
         kwargs = list(self.config['model'].values())[0]
 
+        if estimator == "_NumbaDecisionTreeRegressor":
+            from .experiments._numba_tree import NumbaDecisionTreeRegressor
+            ml_models[estimator] = NumbaDecisionTreeRegressor
+
         if estimator in ['HistGradientBoostingRegressor', 'SGDRegressor', 'MLPRegressor']:
             if self.config['val_fraction'] > 0.0:
                 kwargs.update({'validation_fraction': self.config['val_fraction']})
@@ -880,32 +884,36 @@ class BaseModel(NN):
             if 'random_seed' not in kwargs:
                 kwargs['random_seed'] = self.config['seed']
 
-        if estimator in ["XGBRegressor", "XGBClassifier"]:
+        if estimator in ["XGBRegressor", "XGBClassifier", "XGBRFRegressor", "XGBRFClassifier"]:
             if 'random_state' not in kwargs:
                 kwargs['random_state'] = self.config['seed']
 
         # following sklearn based models accept random_state argument
         if estimator in [
-            "AdaBoostRegressor",
+            "AdaBoostClassifier", "AdaBoostRegressor",
             "BaggingClassifier", "BaggingRegressor",
-            "DecisionTreeClassifier", "DecisionTreeRegressor",
+            "DecisionTreeClassifier", "DecisionTreeRegressor", "_NumbaDecisionTreeRegressor",
+            "DummyClassifier",
             "ExtraTreeClassifier", "ExtraTreeRegressor",
             "ExtraTreesClassifier", "ExtraTreesRegressor",
             "ElasticNet", "ElasticNetCV",
             "GradientBoostingClassifier", "GradientBoostingRegressor",
-            "GaussianProcessRegressor",
+            "GaussianProcessClassifier", "GaussianProcessRegressor",
             "HistGradientBoostingClassifier", "HistGradientBoostingRegressor",
             "LogisticRegression",
             "Lars",
             "Lasso",
             "LassoCV",
             "LassoLars",
-            "LinearSVR",
+            "LinearSVC", "LinearSVR",
+            "NuSVC",
             "MLPClassifier", "MLPRegressor",
             "PassiveAggressiveClassifier", "PassiveAggressiveRegressor",
+            "Perceptron",
             "RandomForestClassifier", "RandomForestRegressor",
-            "RANSACRegressor", "RidgeClassifier",
+            "RANSACRegressor", "Ridge", "RidgeClassifier",
             "SGDClassifier", "SGDRegressor",
+            "SVC",
             "TheilSenRegressor",
         ]:
             if 'random_state' not in kwargs:
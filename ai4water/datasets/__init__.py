@@ -133,6 +133,17 @@ def busan_beach(inputs: list = None,
     return df
 
 
+_NASDAQ_COLUMNS = None
+
+
+def _nasdaq_columns(fname: str) -> list:
+    """columns of nasdaq100 file, read only once from the header of the file"""
+    global _NASDAQ_COLUMNS
+    if _NASDAQ_COLUMNS is None:
+        _NASDAQ_COLUMNS = list(pd.read_csv(fname, nrows=0).columns)
+    return _NASDAQ_COLUMNS
+
+
 def load_nasdaq(inputs: Union[str, list, None] = None, target: str = 'NDX'):
     """Loads Nasdaq100 by downloading it if it is not already downloaded."""
     fname = os.path.join(os.path.dirname(__file__), "nasdaq100_padding.csv")
@@ -142,13 +153,13 @@ def load_nasdaq(inputs: Union[str, list, None] = None, target: str = 'NDX'):
         df = pd.read_csv("https://raw.githubusercontent.com/KurochkinAlexey/DA-RNN/master/nasdaq100_padding.csv")
         df.to_csv(fname)
 
-    df = pd.read_csv(fname)
-    in_cols = list(df.columns)
-    in_cols.remove(target)
     if inputs is None:
-        inputs = in_cols
+        inputs = [col for col in _nasdaq_columns(fname) if col != target]
     target = [target]
 
+    # parse only the columns which are asked for
+    df = pd.read_csv(fname, usecols=inputs + target)
+
     return df[inputs + target]
 
 
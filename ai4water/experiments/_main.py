@@ -6,6 +6,7 @@ from typing import Union, Tuple, List
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
+from joblib import Parallel, delayed, hash as joblib_hash
 from easy_mpl import plot
 from easy_mpl import bar_chart, taylor_plot, dumbbell_plot
 from SeqMetrics import RegressionMetrics, ClassificationMetrics
@@ -86,6 +87,21 @@ class Experiments(object):
     - fit_with_tpot
 
     """
+    # name of model -> (name of its parameter which determines its training
+    # budget, value of this parameter for full budget). Used for successive halving.
+    resource_params = {}
+
+    # models in ``resource_params`` which continue training from the previous
+    # round of successive halving using warm_start. The value tells whether
+    # the resource parameter counts all the estimators/iterations (True) or
+    # only those which are added in the current round (False).
+    warm_start_models = {}
+
+    # models which are much slower than the others with similar performance.
+    # They are skipped when all models are run with fit unless include_slow is True.
+    slow_models = ()
+    include_slow = True
+
     def __init__(
             self,
             cases: dict = None,
@@ -121,6 +137,11 @@ class Experiments(object):
         self.num_samples = num_samples
         self.verbosity = verbosity
 
+        # validation scores of models trained with a part of their budget
+        # keyed by the model, its config, the budget and the data
+        self._scores_cache = {}
+        self._model_paths = {}
+
         self.models = [method for method in dir(self) if callable(getattr(self, method)) if method.startswith('model_')]
 
         if cases is None:
@@ -196,7 +217,13 @@ class Experiments(object):
             exclude: Union[None, list, str] = '',
             cross_validate: bool = False,
             post_optimize: str = 'eval_best',
-            hpo_kws: dict = None
+            hpo_kws: dict = None,
+            eta: int = 3,
+            max_resource: int = 27,
+            n_jobs: int = 1,
+            dry_run_subsample: int = None,
+            prune_trials: bool = False,
+            input_dtype=None,
     ):
         """
         Runs the fit loop for all the ``models`` of experiment. The user can
@@ -208,9 +235,16 @@ class Experiments(object):
         Arguments:
             data: this will be passed to :py:meth:`ai4water.Model.fit`.
             run_type :
-                One of ``dry_run`` or ``optimize``. If ``dry_run``, the all
+                One of ``dry_run``, ``optimize``, ``halving`` or ``hyperband``. If ``dry_run``, the all
                 the `models` will be trained only once. if ``optimize``, then
-                hyperparameters of all the models will be optimized.
+                hyperparameters of all the models will be optimized. If ``halving``,
+                the models are compared using successive halving i.e. all models
+                are first trained with a small budget and only the best 1/``eta``
+                of them are trained again with ``eta`` times more budget. Only
+                the models which survive till the last round are trained with
+                full budget. ``hyperband`` repeats successive halving in
+                several brackets, each of which starts with a different
+                number of models and a different initial budget.
             opt_method :
                 which optimization method to use. options are ``bayes``,
                 ``random``, ``grid``. Only valid if ``run_type`` is ``optimize``
@@ -218,7 +252,9 @@ class Experiments(object):
                 if ``run_type`` is ``optimize``.
             include :
                 name of models to included. If None, all the models found
-                will be trained and or optimized.
+                will be trained and or optimized. For ``dry_run``, ``halving``
+                and ``hyperband``, ``slow_models`` are then skipped unless
+                ``include_slow`` is True.
             exclude :
                 name of ``models`` to be excluded
             cross_validate :
@@ -232,6 +268,33 @@ class Experiments(object):
                 the best model.
             hpo_kws :
                 keyword arguments for :py:class:`ai4water.hyperopt.HyperOpt` class.
+            eta :
+                reduction factor for successive halving. Only valid if ``run_type``
+                is ``halving`` or ``hyperband``.
+            max_resource :
+                ratio of full budget to the smallest budget given to a model. Only
+                valid if ``run_type`` is ``hyperband``.
+            n_jobs :
+                number of processes in which the models are trained in parallel.
+                -1 means all available cores. Only valid if ``run_type`` is ``dry_run``.
+            dry_run_subsample :
+                if given and ``data`` is a DataFrame with more rows than this, the
+                ``dry_run`` uses a random sample of this many rows, keeping their
+                order. This makes the dry run faster but its results are those of
+                models trained on the sample. The rows are sampled randomly, so it
+                should not be used with time series models which use ``lookback``.
+                By default all the rows are used.
+            prune_trials :
+                if True, the trials of ``optimize`` are stopped early using median
+                stopping rule. Each trial of a model in ``resource_params`` is first
+                trained with 10% of its budget and is not trained further if its
+                score is worse than the median of its previous trials. Only valid if
+                ``run_type`` is ``optimize``.
+            input_dtype :
+                if given, the ``input_features`` of ``data`` are converted to this
+                dtype once before training any model. Using ``np.float32`` halves the
+                memory of inputs and avoids a copy in every tree based model which
+                converts the inputs to float32 anyway. The outputs are not converted.
 
         Examples
         ---------
@@ -264,8 +327,12 @@ class Experiments(object):
 
         >>> exp.fit(data=busan_beach(), run_type="optimize", num_iterations=20)
 
+        if you want to spend the full training budget only on the most promising models
+
+        >>> exp.fit(data=busan_beach(), run_type="halving", eta=3)
+
         """
-        assert run_type in ['optimize', 'dry_run']
+        assert run_type in ['optimize', 'dry_run', 'halving', 'hyperband']
 
         assert post_optimize in ['eval_best', 'train_best']
 
@@ -279,6 +346,7 @@ class Experiments(object):
         if hpo_kws is None:
             hpo_kws = {}
 
+        all_models = include is None
         include = self._check_include_arg(include)
 
         if exclude is None:
@@ -288,8 +356,37 @@ class Experiments(object):
 
         consider_exclude(exclude, self.models, include)
 
+        if all_models and run_type != 'optimize' and not self.include_slow:
+            # slow models are only run when asked for explicitly
+            include = [m for m in include if m.split('model_')[1] not in self.slow_models]
+
         self._reset()
 
+        # create the directories of all the models at once instead of inside the loop
+        for model_type in include:
+            if model_type not in exclude:
+                self._model_path(model_type)
+
+        if input_dtype is not None:
+            data = _cast_inputs(data, getattr(self, 'model_kws', {}).get('input_features'), input_dtype)
+
+        if run_type == 'dry_run' and dry_run_subsample is not None:
+            data = _subsample(data, dry_run_subsample)
+
+        if run_type == 'halving':
+            self.halving_scores_ = self._successive_halving(
+                data, [m for m in include if m not in exclude], eta=eta,
+                cross_validate=cross_validate)
+            include = []
+        elif run_type == 'hyperband':
+            self._hyperband(data, [m for m in include if m not in exclude], eta=eta,
+                            max_resource=max_resource, cross_validate=cross_validate)
+            include = []
+        elif run_type == 'dry_run' and n_jobs != 1:
+            self._parallel_dry_run(data, [m for m in include if m not in exclude],
+                                   n_jobs=n_jobs, cross_validate=cross_validate)
+            include = []
+
         for model_type in include:
 
             model_name = model_type.split('model_')[1]
@@ -299,18 +396,18 @@ class Experiments(object):
                 self.model_iter_metric = {}
                 self.iter_ = 0
 
+                partial_scores = []
+
                 def objective_fn(**suggested_paras):
+                    if prune_trials and run_type == 'optimize':
+                        score = self._prune_trial(model_type, data, partial_scores,
+                                                  cross_validate=cross_validate,
+                                                  **suggested_paras)
+                        if score is not None:
+                            return score
+
                     # the config must contain the suggested parameters by the hpo algorithm
-                    if model_type in self.cases:
-                        config = self.cases[model_type]
-                        config.update(suggested_paras)
-                    elif model_name in self.cases:
-                        config = self.cases[model_name]
-                        config.update(suggested_paras)
-                    elif hasattr(self, model_type):
-                        config = getattr(self, model_type)(**suggested_paras)
-                    else:
-                        raise TypeError
+                    config = self._get_config(model_type, **suggested_paras)
 
                     return self._build_and_run(
                         data=data,
@@ -329,8 +426,7 @@ class Experiments(object):
                     if hasattr(self, model_type):
                         getattr(self, model_type)()
 
-                    opt_dir = os.path.join(os.getcwd(),
-                        f"results{SEP}{self.exp_name}{SEP}{model_name}")
+                    opt_dir = self._model_path(model_type)
 
                     if self.verbosity > 0: 
                         print(f"optimizing  {model_type} using {opt_method} method")
@@ -373,6 +469,280 @@ class Experiments(object):
 
         return
 
+    def _model_path(self, model_type: str) -> str:
+        """directory of ``model_type`` inside ``exp_path``. It is created only once."""
+        if model_type not in self._model_paths:
+            path = os.path.join(self.exp_path, model_type.split('model_')[1])
+            os.makedirs(path, exist_ok=True)
+            self._model_paths[model_type] = path
+        return self._model_paths[model_type]
+
+    def _get_config(self, model_type: str, **suggested_paras) -> dict:
+        """returns the config of ``model_type`` which is passed to ai4water's Model"""
+        model_name = model_type.split('model_')[1]
+        if model_type in self.cases:
+            config = self.cases[model_type]
+            config.update(suggested_paras)
+        elif model_name in self.cases:
+            config = self.cases[model_name]
+            config.update(suggested_paras)
+        elif hasattr(self, model_type):
+            config = getattr(self, model_type)(**suggested_paras)
+        else:
+            raise TypeError
+        return config
+
+    def _successive_halving(
+            self,
+            data,
+            models: list,
+            eta: int = 3,
+            cross_validate=False,
+            num_rounds: int = None,
+            trained: dict = None,
+    ) -> dict:
+        """
+        Compares the models using successive halving. In each round all the
+        remaining models are trained with a fraction of the full budget and
+        the best ``1/eta`` of them are kept for the next round in which the
+        budget is ``eta`` times larger. In the last round the
+        surviving models are trained with full budget and their results are
+        populated as in ``dry_run``.
+
+        The budget of a model is the value of its parameter given in
+        ``resource_params`` e.g. ``n_estimators`` or ``max_iter``. For the
+        models which are not in ``resource_params``, the budget is the number
+        of examples in data which are taken at regular intervals.
+
+        The first round uses ``eta**-num_rounds`` of the full budget. By default
+        ``num_rounds`` is chosen such that one model survives the last halving.
+        ``trained`` maps the models which are already trained with full budget
+        to their validation score. These are not trained again. Similarly, the
+        scores with partial budget are cached so that a model is not trained
+        twice with the same config, budget and data.
+
+        Returns a dictionary whose keys are budgets and values are the
+        validation scores of the models trained in that round.
+        """
+        assert eta >= 2, f"eta must be 2 or larger but it is {eta}"
+
+        if num_rounds is None:
+            num_rounds = math.ceil(round(math.log(len(models), eta), 8)) if len(models) > 1 else 0
+
+        if trained is None:
+            trained = {}
+
+        round_scores = {}
+        data_hash = _data_hash(data)
+        # estimators of previous round which can be trained further
+        estimators = {}
+
+        for _round in range(num_rounds + 1):
+            # once a single model is left, there is nothing to compare
+            last_round = _round == num_rounds or len(models) == 1
+            resource = 1.0 if last_round else float(eta) ** (_round - num_rounds)
+
+            scores = {}
+            for model_type in models:
+
+                if last_round and model_type in trained:
+                    scores[model_type] = trained[model_type]
+                    continue
+
+                config, _data = self._apply_resource(model_type, data, resource)
+
+                key = (model_type, joblib_hash(config), resource, cross_validate, data_hash)
+                if not last_round and key in self._scores_cache:
+                    scores[model_type] = self._scores_cache[key]
+                    continue
+
+                self.model_iter_metric = {}
+                self.iter_ = 0
+
+                if self.verbosity >= 0:
+                    print(f"running  {model_type} model with {round(resource, 4)} of budget")
+
+                model_name = model_type.split('model_')[1]
+                estimator = None
+                if model_name in self.warm_start_models and not cross_validate:
+                    list(config['model'].values())[0]['warm_start'] = True
+                    estimator = self._warm_start(model_type, config, estimators.get(model_type))
+
+                result = self._build_and_run(
+                    data=_data,
+                    predict=last_round,
+                    cross_validate=cross_validate,
+                    title=f"{self.exp_name}{SEP}{model_name}",
+                    estimator=estimator,
+                    **config)
+
+                if model_name in self.warm_start_models and not cross_validate:
+                    param, _ = self.resource_params[model_name]
+                    estimators[model_type] = (self.model_._model,
+                                              list(config['model'].values())[0][param])
+
+                if last_round:
+                    self._populate_results(model_type, *result)
+                    self.config['eval_models'][model_type] = self.model_.path
+
+                    if cross_validate:
+                        cv_scoring = self.model_.val_metric
+                        self.cv_scores_[model_type] = getattr(self.model_, f'cross_val_{cv_scoring}')
+                        setattr(self, '_cv_scoring', cv_scoring)
+
+                    scores[model_type] = trained[model_type] = self._evaluate()
+                    self.iter_metrics[model_type] = self.model_iter_metric
+                else:
+                    scores[model_type] = self._scores_cache[key] = result
+
+            round_scores[resource] = scores
+
+            if last_round:
+                break
+
+            # smaller validation score is better
+            models = sorted(scores, key=scores.get)[:max(1, len(models) // eta)]
+
+        return round_scores
+
+    def _warm_start(self, model_type: str, config: dict, previous: tuple = None):
+        """sets the resource parameter of an estimator trained in previous round
+        of successive halving so that it can be trained further. ``previous``
+        is a tuple of the estimator and the budget it has been trained with."""
+        if previous is None:
+            return None
+
+        estimator, trained_budget = previous
+        model_name = model_type.split('model_')[1]
+        param, _ = self.resource_params[model_name]
+        budget = list(config['model'].values())[0][param]
+
+        if not self.warm_start_models[model_name]:
+            # only train for the remaining iterations
+            budget = max(1, budget - trained_budget)
+
+        estimator.set_params(**{param: budget})
+        return estimator
+
+    def _parallel_dry_run(self, data, models: list, n_jobs: int = -1, cross_validate=False):
+        """trains the models in separate processes and populates their results"""
+        outputs = Parallel(n_jobs=n_jobs, backend='loky')(
+            delayed(_dry_run)(self, model_type, data, cross_validate) for model_type in models)
+
+        for model_type, output in zip(models, outputs):
+            train_results, test_results, path, is_multiclass, cv_scoring, cv_scores, iter_metric = output
+
+            self._populate_results(model_type, train_results, test_results, is_multiclass=is_multiclass)
+            self.config['eval_models'][model_type] = path
+
+            if cross_validate:
+                self.cv_scores_[model_type] = cv_scores
+                setattr(self, '_cv_scoring', cv_scoring)
+
+            self.iter_metrics[model_type] = iter_metric
+        return
+
+    def _hyperband(
+            self,
+            data,
+            models: list,
+            eta: int = 3,
+            max_resource: int = 27,
+            cross_validate=False,
+    ):
+        """
+        Runs successive halving in brackets. The bracket ``s`` starts with
+        ``ceil((s_max+1)/(s+1) * eta**s)`` randomly chosen models and
+        ``eta**-s`` of the full budget, where ``s_max = floor(log_eta(max_resource))``.
+        Thus the first bracket compares many models with small budgets while
+        the last bracket trains a few models with full budget. The scores are
+        saved in ``hyperband_scores_`` and the best model across all brackets
+        in ``hyperband_best_``.
+        """
+        s_max = int(math.floor(round(math.log(max_resource, eta), 8)))
+        rng = np.random.default_rng(313)
+
+        trained = {}
+        self.hyperband_scores_ = {}
+
+        for s in range(s_max, -1, -1):
+            n = min(len(models), math.ceil((s_max + 1) / (s + 1) * eta ** s))
+            bracket_models = [models[i] for i in sorted(rng.choice(len(models), n, replace=False))]
+
+            self.hyperband_scores_[s] = self._successive_halving(
+                data, bracket_models, eta=eta, cross_validate=cross_validate,
+                num_rounds=s, trained=trained)
+
+        best = min(trained, key=trained.get)
+        self.hyperband_best_ = (best, trained[best])
+        return
+
+    def _apply_resource(
+            self,
+            model_type: str,
+            data,
+            resource: float,
+            min_examples: int = 500,
+            **suggested_paras
+    ):
+        """returns the config of model and the data so that the model is
+        trained with ``resource`` fraction of its full budget. When the budget
+        is the number of examples, at least ``min_examples`` are kept."""
+        model_name = model_type.split('model_')[1]
+
+        if model_name in self.resource_params:
+            param, full_budget = self.resource_params[model_name]
+            full_budget = suggested_paras.pop(param, full_budget)
+            suggested_paras[param] = max(1, int(full_budget * resource))
+            config = self._get_config(model_type, **suggested_paras)
+            return config, data
+
+        config = self._get_config(model_type, **suggested_paras)
+        if resource < 1.0 and isinstance(data, pd.DataFrame):
+            # evenly spaced examples so that the time index remains regular
+            step = min(round(1.0 / resource), len(data) // min_examples)
+            data = data.iloc[::max(1, step)]
+        return config, data
+
+    def _prune_trial(
+            self,
+            model_type: str,
+            data,
+            history: list,
+            cross_validate=False,
+            resource: float = 0.1,
+            n_startup_trials: int = 5,
+            **suggested_paras
+    ):
+        """Median stopping rule for an optimization trial. The model is first
+        trained with ``resource`` fraction of its budget. If this score is worse
+        than the median score of the previous trials with the same budget, the
+        trial is stopped and this score is returned. Otherwise, None is returned and
+        the trial is continued with full budget. Only the models in
+        ``resource_params`` are pruned and no trial is pruned before
+        ``n_startup_trials`` trials are finished.
+        """
+        if model_type.split('model_')[1] not in self.resource_params:
+            return None
+
+        config, _data = self._apply_resource(model_type, data, resource, **suggested_paras)
+
+        score = self._build_and_run(
+            data=_data,
+            predict=False,
+            cross_validate=cross_validate,
+            title=f"{self.exp_name}{SEP}{model_type.split('model_')[1]}",
+            **config)
+
+        pruned = len(history) >= n_startup_trials and score > np.median(history)
+        history.append(score)
+
+        if pruned:
+            if self.verbosity > 0:
+                print(f"pruned trial of {model_type} with score {score}")
+            return score
+        return None
+
     def eval_best(self, data, model_type, opt_dir, **kwargs):
         """Evaluate the best models."""
         best_models = clear_weights(opt_dir, rename=False, write=False)
@@ -412,7 +782,8 @@ class Experiments(object):
 
     def _populate_results(self, model_type: str,
                           train_results: Tuple[np.ndarray, np.ndarray],
-                          test_results: Tuple[np.ndarray, np.ndarray]
+                          test_results: Tuple[np.ndarray, np.ndarray],
+                          is_multiclass: bool = None,
                           ):
 
         if not model_type.startswith('model_'):  # internally we always use model_ at the start.
@@ -432,17 +803,20 @@ class Experiments(object):
                 'simulation': {
                     'std': np.std(test_results[1])}}}
 
+        if is_multiclass is None:
+            is_multiclass = self.model_.is_multiclass
+
         # save performance metrics of train and test
         metrics = Metrics[self.mode](train_results[0],
                                      train_results[1],
-                                     multiclass=self.model_.is_multiclass)
+                                     multiclass=is_multiclass)
         train_metrics = {}
         for metric in self.monitor:
             train_metrics[metric] = getattr(metrics, metric)()
 
         metrics = Metrics[self.mode](test_results[0],
                                      test_results[1],
-                                     multiclass=self.model_.is_multiclass)
+                                     multiclass=is_multiclass)
         test_metrics = {}
         for metric in self.monitor:
             test_metrics[metric] = getattr(metrics, metric)()
@@ -1280,16 +1654,21 @@ Available cases are {self.models} and you wanted to include
         view=False,
         title=None,
         cross_validate=False,
+        estimator=None,
         **kwargs):
 
         """
         Builds and run one 'model' of the experiment.
 
         Since an experiment consists of many models, this method
-        is also run many times.
+        is also run many times. If ``estimator`` is given, it is trained
+        instead of the estimator built from ``kwargs``.
         """
         model = self._build(title=title, **kwargs)
 
+        if estimator is not None:
+            self.model_._model = estimator
+
         self._fit(data=data, cross_validate=cross_validate)
 
         if view:
@@ -1349,7 +1728,7 @@ Available cases are {self.models} and you wanted to include
 
         val_score = getattr(metrics, self.model_.val_metric)()
 
-        if self.model_.config['val_metric'] in [
+        if self.model_.val_metric in [
             'r2', 'nse', 'kge', 'r2_mod', 'r2_adj', 'r2_score', 'accuracy', 'f1_score']:
             val_score = 1.0 - val_score
         
@@ -1484,6 +1863,51 @@ be used to build ai4water's Model class.
         return model
 
 
+def _data_hash(data) -> str:
+    """hash of the contents of data. The hash of DataFrame itself changes when
+    pandas populates its internal caches, so the rows are hashed instead."""
+    if isinstance(data, pd.DataFrame):
+        return joblib_hash((data.columns.tolist(), pd.util.hash_pandas_object(data).values))
+    return joblib_hash(data)
+
+
+def _cast_inputs(data, input_features, dtype):
+    """converts the input features of DataFrame to dtype"""
+    if not isinstance(data, pd.DataFrame) or input_features is None:
+        return data
+    if isinstance(input_features, str):
+        input_features = [input_features]
+    return data.astype({feature: dtype for feature in input_features})
+
+
+def _subsample(data, num_rows: int, seed: int = 313):
+    """randomly selects ``num_rows`` rows from DataFrame without changing their order"""
+    if isinstance(data, pd.DataFrame) and len(data) > num_rows:
+        rng = np.random.default_rng(seed)
+        return data.iloc[np.sort(rng.choice(len(data), num_rows, replace=False))]
+    return data
+
+
+def _dry_run(exp: Experiments, model_type: str, data, cross_validate: bool = False):
+    """trains one model of the experiment. It is run in a separate process
+    and returns everything that the parent process needs to populate the results."""
+    exp.model_iter_metric = {}
+    exp.iter_ = 0
+
+    train_results, test_results = exp._build_and_run(
+        data=data,
+        predict=True,
+        cross_validate=cross_validate,
+        title=f"{exp.exp_name}{SEP}{model_type.split('model_')[1]}",
+        **exp._get_config(model_type))
+
+    cv_scoring = exp.model_.val_metric
+    cv_scores = getattr(exp.model_, f'cross_val_{cv_scoring}') if cross_validate else None
+
+    return (train_results, test_results, exp.model_.path, exp.model_.is_multiclass,
+            cv_scoring, cv_scores, exp.model_iter_metric)
+
+
 def sort_array(array):
     """
     array: [4, 7, 3, 9, 4, 8, 2, 8, 7, 1]
@@ -0,0 +1,214 @@
+"""
+A regression tree whose split search is compiled with numba. The features are
+sorted only once before growing the tree and the tree is then grown level by
+level so that each level requires a single pass over the presorted features.
+"""
+
+import math
+
+import numpy as np
+from sklearn.base import BaseEstimator, RegressorMixin
+
+try:
+    import numba
+except ModuleNotFoundError:
+    numba = None
+
+prange = range if numba is None else numba.prange
+
+
+def _best_splits(X, y, order, node_of, node_sum, node_count, feature_mask, min_samples_leaf):
+    """finds the best threshold of every feature for every node of the current level.
+
+    Only the samples with ``node_of >= 0`` belong to a node which can still be split.
+    Returns the score (sum_left**2/n_left + sum_right**2/n_right) and the threshold
+    for every (feature, node) pair.
+    """
+    n, n_features = X.shape
+    n_nodes = node_sum.shape[0]
+    scores = np.full((n_features, n_nodes), -np.inf)
+    thresholds = np.zeros((n_features, n_nodes))
+
+    for j in prange(n_features):
+        left_sum = np.zeros(n_nodes)
+        left_count = np.zeros(n_nodes, dtype=np.int64)
+        last = np.zeros(n_nodes)
+
+        for r in range(n):
+            i = order[r, j]
+            k = node_of[i]
+            if k < 0 or not feature_mask[j, k]:
+                continue
+            x = X[i, j]
+            n_left = left_count[k]
+            n_right = node_count[k] - n_left
+            if n_left >= min_samples_leaf and n_right >= min_samples_leaf and x > last[k]:
+                s_left = left_sum[k]
+                s_right = node_sum[k] - s_left
+                score = s_left * s_left / n_left + s_right * s_right / n_right
+                if score > scores[j, k]:
+                    scores[j, k] = score
+                    thr = (last[k] + x) / 2.0
+                    if thr == x:  # rounding error
+                        thr = last[k]
+                    thresholds[j, k] = thr
+            left_sum[k] += y[i]
+            left_count[k] += 1
+            last[k] = x
+
+    return scores, thresholds
+
+
+def _predict(X, feature, threshold, left, right, value):
+    out = np.empty(X.shape[0])
+    for i in prange(X.shape[0]):
+        node = 0
+        while left[node] >= 0:
+            if X[i, feature[node]] <= threshold[node]:
+                node = left[node]
+            else:
+                node = right[node]
+        out[i] = value[node]
+    return out
+
+
+if numba is not None:
+    _best_splits = numba.njit(parallel=True, cache=True)(_best_splits)
+    _predict = numba.njit(parallel=True, cache=True)(_predict)
+
+
+class NumbaDecisionTreeRegressor(BaseEstimator, RegressorMixin):
+    """
+    Decision tree regressor using squared error criterion and the ``best``
+    splitter. It supports a subset of the arguments of sklearn's
+    DecisionTreeRegressor_.
+
+    Arguments:
+        max_depth : maximum depth of the tree. If None, the nodes are expanded
+            until they can not be split anymore.
+        min_samples_split : minimum number of samples required to split a node.
+        min_samples_leaf : minimum number of samples in a leaf node.
+        min_weight_fraction_leaf : minimum fraction of samples in a leaf node.
+        max_features : number of features to consider when looking for the best
+            split. Can be an int, float, "auto", "sqrt", "log2" or None.
+        random_state : seed used to select the features when ``max_features``
+            is less than number of features.
+
+    .. _DecisionTreeRegressor:
+        https://scikit-learn.org/stable/modules/generated/sklearn.tree.DecisionTreeRegressor.html
+    """
+    def __init__(
+            self,
+            max_depth: int = None,
+            min_samples_split: int = 2,
+            min_samples_leaf: int = 1,
+            min_weight_fraction_leaf: float = 0.0,
+            max_features=None,
+            random_state: int = None,
+    ):
+        self.max_depth = max_depth
+        self.min_samples_split = min_samples_split
+        self.min_samples_leaf = min_samples_leaf
+        self.min_weight_fraction_leaf = min_weight_fraction_leaf
+        self.max_features = max_features
+        self.random_state = random_state
+
+    def _num_features(self, n_features: int) -> int:
+        max_features = self.max_features
+        if max_features in (None, "auto"):
+            return n_features
+        elif max_features == "sqrt":
+            return max(1, int(math.sqrt(n_features)))
+        elif max_features == "log2":
+            return max(1, int(math.log2(n_features)))
+        elif isinstance(max_features, float):
+            return max(1, int(max_features * n_features))
+        return min(n_features, int(max_features))
+
+    def fit(self, X, y):
+        if numba is None:
+            raise ModuleNotFoundError("NumbaDecisionTreeRegressor requires numba")
+
+        X = np.ascontiguousarray(X, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        if y.ndim == 2:
+            assert y.shape[1] == 1, f"only one output is supported but y has shape {y.shape}"
+            y = y.reshape(-1, )
+
+        n, n_features = X.shape
+        self.n_features_in_ = n_features
+        min_leaf = max(self.min_samples_leaf, math.ceil(self.min_weight_fraction_leaf * n))
+        n_try = self._num_features(n_features)
+        rng = np.random.default_rng(self.random_state)
+
+        # presort the samples by every feature only once
+        order = np.argsort(X, axis=0, kind="stable")
+
+        feature, threshold, left, right, value = [-1], [0.0], [-1], [-1], [0.0]
+        node_of = np.zeros(n, dtype=np.int64)  # node of each sample within the current level
+        level = [0]  # ids of the nodes of current level within the tree
+        depth = 0
+        while level:
+            active = node_of >= 0
+            node_sum = np.bincount(node_of[active], weights=y[active], minlength=len(level))
+            node_count = np.bincount(node_of[active], minlength=len(level))
+            for k, node in enumerate(level):
+                value[node] = node_sum[k] / node_count[k]
+
+            if self.max_depth is not None and depth >= self.max_depth:
+                break
+
+            feature_mask = np.ones((n_features, len(level)), dtype=np.bool_)
+            if n_try < n_features:
+                feature_mask = rng.random(feature_mask.shape).argsort(axis=0) < n_try
+
+            scores, thresholds = _best_splits(X, y, order, node_of, node_sum, node_count,
+                                              feature_mask, min_leaf)
+
+            best = scores.argmax(axis=0)
+            children = np.full((len(level), 2), -1, dtype=np.int64)
+            new_level = []
+            for k, node in enumerate(level):
+                j = best[k]
+                if node_count[k] < self.min_samples_split or \
+                        scores[j, k] <= node_sum[k] ** 2 / node_count[k] * (1 + 1e-12):
+                    continue  # leaf
+                feature[node], threshold[node] = int(j), thresholds[j, k]
+                for c in range(2):
+                    feature.append(-1)
+                    threshold.append(0.0)
+                    left.append(-1)
+                    right.append(-1)
+                    value.append(0.0)
+                    children[k, c] = len(new_level)
+                    new_level.append(len(value) - 1)
+                left[node], right[node] = new_level[-2], new_level[-1]
+
+            # move the samples to the nodes of next level
+            idx = np.flatnonzero(active)
+            k = node_of[idx]
+            goes_left = X[idx, best[k]] <= thresholds[best[k], k]
+            node_of[idx] = np.where(goes_left, children[k, 0], children[k, 1])
+
+            level = new_level
+            if level:
+                depth += 1
+
+        self.tree_ = {"feature": np.array(feature, dtype=np.int64),
+                      "threshold": np.array(threshold),
+                      "left": np.array(left, dtype=np.int64),
+                      "right": np.array(right, dtype=np.int64),
+                      "value": np.array(value)}
+        self.max_depth_ = depth
+        return self
+
+    def predict(self, X):
+        X = np.ascontiguousarray(X, dtype=np.float64)
+        return _predict(X, **self.tree_)
+
+    def apply(self, X):
+        """returns index of the leaf for each sample in X"""
+        X = np.ascontiguousarray(X, dtype=np.float64)
+        return _predict(X, self.tree_["feature"], self.tree_["threshold"], self.tree_["left"],
+                        self.tree_["right"], np.arange(len(self.tree_["value"]), dtype=np.float64)
+                        ).astype(np.int64)
@@ -1,29 +1,173 @@
 
 __all__ = ["MLRegressionExperiments"]
 
+import copy
+import shutil
+import importlib.util
+from functools import lru_cache
+
 from ai4water.utils.utils import get_version_info, dateandtime_now
 from ._main import Experiments
-from .utils import regression_space
+from .utils import regression_space, _model_method
 
 
-try:
-    import catboost
-except ModuleNotFoundError:
-    catboost = None
+# the libraries are only checked for availability, they are imported when
+# the model is built
+_HAS_CATBOOST = importlib.util.find_spec('catboost') is not None
+_HAS_LIGHTGBM = importlib.util.find_spec('lightgbm') is not None
+_HAS_XGBOOST = importlib.util.find_spec('xgboost') is not None
 
-try:
-    import lightgbm
-except ModuleNotFoundError:
-    lightgbm = None
+import sklearn
+
+VERSION_INFO = get_version_info(sklearn=sklearn)
+_SK_VER = tuple(map(int, sklearn.__version__.split('.')[:2]))
+
+# name of each model and the path to its estimator. For every entry, a
+# ``model_<name>`` method is added to MLRegressionExperiments
+_MODELS = {
+    # https://scikit-learn.org/stable/modules/generated/sklearn.ensemble.AdaBoostRegressor.html
+    "AdaBoostRegressor": "sklearn.ensemble.AdaBoostRegressor",
+    # https://scikit-learn.org/stable/modules/generated/sklearn.linear_model.ARDRegression.html
+    "ARDRegression": "sklearn.linear_model.ARDRegression",
+    "BaggingRegressor": "sklearn.ensemble.BaggingRegressor",
+    # https://scikit-learn.org/stable/modules/generated/sklearn.linear_model.BayesianRidge.html
+    "BayesianRidge": "sklearn.linear_model.BayesianRidge",
+    # https://catboost.ai/docs/concepts/python-reference_parameters-list.html
+    "CatBoostRegressor": "catboost.CatBoostRegressor",
+    # https://scikit-learn.org/stable/modules/generated/sklearn.linear_model.ElasticNet.html
+    "ElasticNet": "sklearn.linear_model.ElasticNet",
+    # https://scikit-learn.org/stable/modules/generated/sklearn.linear_model.ElasticNetCV.html
+    "ElasticNetCV": "sklearn.linear_model.ElasticNetCV",
+    # https://scikit-learn.org/stable/modules/generated/sklearn.tree.ExtraTreeRegressor.html
+    "ExtraTreeRegressor": "sklearn.tree.ExtraTreeRegressor",
+    # https://scikit-learn.org/stable/modules/generated/sklearn.ensemble.ExtraTreesRegressor.html
+    "ExtraTreesRegressor": "sklearn.ensemble.ExtraTreesRegressor",
+    # https://scikit-learn.org/stable/modules/generated/sklearn.gaussian_process.GaussianProcessRegressor.html
+    "GaussianProcessRegressor": "sklearn.gaussian_process.GaussianProcessRegressor",
+    # https://scikit-learn.org/stable/modules/generated/sklearn.ensemble.GradientBoostingRegressor.html
+    "GradientBoostingRegressor": "sklearn.ensemble.GradientBoostingRegressor",
+    # https://scikit-learn.org/stable/modules/generated/sklearn.ensemble.HistGradientBoostingRegressor.html
+    "HistGradientBoostingRegressor": "sklearn.ensemble.HistGradientBoostingRegressor",
+    # https://scikit-learn.org/stable/modules/generated/sklearn.linear_model.HuberRegressor.html
+    "HuberRegressor": "sklearn.linear_model.HuberRegressor",
+    # https://scikit-learn.org/stable/modules/generated/sklearn.kernel_ridge.KernelRidge.html
+    "KernelRidge": "sklearn.kernel_ridge.KernelRidge",
+    # https://scikit-learn.org/stable/modules/generated/sklearn.neighbors.KNeighborsRegressor.html
+    "KNeighborsRegressor": "sklearn.neighbors.KNeighborsRegressor",
+    # https://scikit-learn.org/stable/modules/generated/sklearn.linear_model.LassoLars.html
+    "LassoLars": "sklearn.linear_model.LassoLars",
+    # https://scikit-learn.org/stable/modules/generated/sklearn.linear_model.Lars.html
+    "Lars": "sklearn.linear_model.Lars",
+    # https://scikit-learn.org/stable/modules/generated/sklearn.linear_model.LarsCV.html
+    "LarsCV": "sklearn.linear_model.LarsCV",
+    # https://scikit-learn.org/stable/modules/generated/sklearn.svm.LinearSVR.html
+    "LinearSVR": "sklearn.svm.LinearSVR",
+    # https://scikit-learn.org/stable/modules/generated/sklearn.linear_model.Lasso.html
+    "Lasso": "sklearn.linear_model.Lasso",
+    # https://scikit-learn.org/stable/modules/generated/sklearn.linear_model.LassoCV.html
+    "LassoCV": "sklearn.linear_model.LassoCV",
+    # https://scikit-learn.org/stable/modules/generated/sklearn.linear_model.LassoLarsCV.html
+    "LassoLarsCV": "sklearn.linear_model.LassoLarsCV",
+    # https://scikit-learn.org/stable/modules/generated/sklearn.linear_model.LassoLarsIC.html
+    "LassoLarsIC": "sklearn.linear_model.LassoLarsIC",
+    # https://lightgbm.readthedocs.io/en/latest/pythonapi/lightgbm.LGBMRegressor.html
+    "LGBMRegressor": "lightgbm.LGBMRegressor",
+    # https://scikit-learn.org/stable/modules/generated/sklearn.linear_model.LinearRegression.html
+    "LinearRegression": "sklearn.linear_model.LinearRegression",
+    # https://scikit-learn.org/stable/modules/generated/sklearn.neural_network.MLPRegressor.html
+    "MLPRegressor": "sklearn.neural_network.MLPRegressor",
+    # https://scikit-learn.org/stable/modules/generated/sklearn.svm.NuSVR.html
+    "NuSVR": "sklearn.svm.NuSVR",
+    # https://scikit-learn.org/stable/modules/generated/sklearn.linear_model.OrthogonalMatchingPursuit.html
+    "OrthogonalMatchingPursuit": "sklearn.linear_model.OrthogonalMatchingPursuit",
+    # https://scikit-learn.org/stable/modules/generated/sklearn.linear_model.OrthogonalMatchingPursuitCV.html
+    "OrthogonalMatchingPursuitCV": "sklearn.linear_model.OrthogonalMatchingPursuitCV",
+    # https://scikit-learn.org/stable/modules/generated/sklearn.svm.OneClassSVM.html
+    "OneClassSVM": "sklearn.svm.OneClassSVM",
+    # https://scikit-learn.org/stable/modules/generated/sklearn.linear_model.PoissonRegressor.html
+    "PoissonRegressor": "sklearn.linear_model.PoissonRegressor",
+    # https://scikit-learn.org/stable/modules/generated/sklearn.linear_model.Ridge.html
+    "Ridge": "sklearn.linear_model.Ridge",
+    # https://scikit-learn.org/stable/modules/generated/sklearn.linear_model.RidgeCV.html
+    "RidgeCV": "sklearn.linear_model.RidgeCV",
+    # https://scikit-learn.org/stable/modules/generated/sklearn.neighbors.RadiusNeighborsRegressor.html
+    "RadiusNeighborsRegressor": "sklearn.neighbors.RadiusNeighborsRegressor",
+    # https://scikit-learn.org/stable/modules/generated/sklearn.linear_model.RANSACRegressor.html
+    "RANSACRegressor": "sklearn.linear_model.RANSACRegressor",
+    # https://scikit-learn.org/stable/modules/generated/sklearn.ensemble.RandomForestRegressor.html
+    "RandomForestRegressor": "sklearn.ensemble.RandomForestRegressor",
+    # https://scikit-learn.org/stable/modules/generated/sklearn.svm.SVR.html
+    "SVR": "sklearn.svm.SVR",
+    # https://scikit-learn.org/stable/modules/generated/sklearn.linear_model.SGDRegressor.html
+    "SGDRegressor": "sklearn.linear_model.SGDRegressor",
+    # https://scikit-learn.org/stable/modules/generated/sklearn.linear_model.TweedieRegressor.html
+    "TweedieRegressor": "sklearn.linear_model.TweedieRegressor",
+    # https://xgboost.readthedocs.io/en/latest/python/python_api.html#xgboost.XGBRFRegressor
+    "XGBRFRegressor": "xgboost.XGBRFRegressor",
+    # https://xgboost.readthedocs.io/en/latest/python/python_api.html#xgboost.XGBRegressor
+    "XGBRegressor": "xgboost.XGBRegressor",
+}
+
+# arguments of models which are used unless given by the user
+_DEFAULTS = {
+    "HistGradientBoostingRegressor": {"early_stopping": True, "max_iter": 200},
+    "LGBMRegressor": {"n_jobs": -1, "force_col_wise": True},
+}
+
+# use all cores for the models which can run in parallel
+for _name in ["BaggingRegressor", "ElasticNetCV", "ExtraTreesRegressor", "KNeighborsRegressor",
+              "LarsCV", "LassoCV", "LassoLarsCV", "LinearRegression",
+              "OrthogonalMatchingPursuitCV", "RadiusNeighborsRegressor",
+              "RandomForestRegressor"]:
+    _DEFAULTS.setdefault(_name, {})["n_jobs"] = -1
+
+
+@lru_cache(maxsize=None)
+def _xgboost_defaults() -> dict:
+    """histogram based tree method using all cores, or the gpu if xgboost
+    is built with cuda and a gpu is found."""
+    defaults = {"n_jobs": -1, "tree_method": "hist"}
+
+    if shutil.which("nvidia-smi") is None:
+        return defaults
 
-try:
     import xgboost
-except ModuleNotFoundError:
-    xgboost = None
+    if not xgboost.build_info().get("USE_CUDA", False):
+        return defaults
 
-import sklearn
+    if int(xgboost.__version__.split('.')[0]) >= 2:
+        defaults["device"] = "cuda"
+    else:
+        defaults["tree_method"] = "gpu_hist"
+    return defaults
+
+
+_DEFAULTS["XGBRegressor"] = _DEFAULTS["XGBRFRegressor"] = _xgboost_defaults
+
+
+# models which can not be used with the installed libraries
+_UNAVAILABLE = set()
+if not _HAS_CATBOOST:
+    _UNAVAILABLE.add('model_CatBoostRegressor')
+if not _HAS_LIGHTGBM:
+    _UNAVAILABLE.add('model_LGBMRegressor')
+if not _HAS_XGBOOST:
+    _UNAVAILABLE.update(['model_XGBRFRegressor', 'model_XGBRegressor'])
+if _SK_VER < (0, 23):
+    _UNAVAILABLE.update(['model_PoissonRegressor', 'model_TweedieRegressor'])
 
-VERSION_INFO = get_version_info(sklearn=sklearn)
+
+@lru_cache(maxsize=16)
+def _regression_space(num_samples: int) -> dict:
+    # shared by all the instances, it must not be modified
+    return regression_space(num_samples=num_samples)
+
+
+def _cached_regression_space(num_samples: int) -> dict:
+    """regression_space is built only once for each value of num_samples.
+    Every call returns a copy, which can be modified without affecting the
+    other instances."""
+    return copy.deepcopy(_regression_space(num_samples))
 
 
 class MLRegressionExperiments(Experiments):
@@ -42,6 +186,41 @@ class MLRegressionExperiments(Experiments):
     and the initial values to use for optimization.
 
     """
+    resource_params = {
+        "AdaBoostRegressor": ("n_estimators", 50),
+        "BaggingRegressor": ("n_estimators", 10),
+        "CatBoostRegressor": ("n_estimators", 1000),
+        "ElasticNet": ("max_iter", 1000),
+        "ExtraTreesRegressor": ("n_estimators", 100),
+        "GradientBoostingRegressor": ("n_estimators", 100),
+        "HistGradientBoostingRegressor": ("max_iter", 200),
+        "HuberRegressor": ("max_iter", 100),
+        "Lasso": ("max_iter", 1000),
+        "LGBMRegressor": ("n_estimators", 100),
+        "MLPRegressor": ("max_iter", 200),
+        "RandomForestRegressor": ("n_estimators", 100),
+        "SGDRegressor": ("max_iter", 1000),
+        "XGBRFRegressor": ("n_estimators", 100),
+        "XGBRegressor": ("n_estimators", 100),
+    }
+
+    warm_start_models = {
+        "BaggingRegressor": True,
+        "ExtraTreesRegressor": True,
+        "GradientBoostingRegressor": True,
+        "HistGradientBoostingRegressor": True,
+        "RandomForestRegressor": True,
+        "ElasticNet": False,
+        "HuberRegressor": False,
+        "Lasso": False,
+        "MLPRegressor": False,
+        "SGDRegressor": False,
+    }
+
+    # HistGradientBoostingRegressor and LGBMRegressor are much faster alternatives
+    # of GradientBoostingRegressor and XGBRFRegressor
+    slow_models = ("GradientBoostingRegressor", "XGBRFRegressor", "KernelRidge",
+                   "GaussianProcessRegressor")
 
     def __init__(self,
                  param_space=None,
@@ -50,6 +229,8 @@ class MLRegressionExperiments(Experiments):
                  exp_name='MLRegressionExperiments',
                  num_samples=5,
                  verbosity=1,
+                 include_slow=False,
+                 tree_backend="sklearn",
                  **model_kwargs):
         """
         Initializes the class
@@ -60,6 +241,10 @@ class MLRegressionExperiments(Experiments):
             x0 list: initial values of the parameters which are to be optimized.
                 These can be overwritten in `models`
             exp_name str: name of experiment, all results will be saved within this folder
+            include_slow bool: if True, the ``slow_models`` are also run when ``fit``
+                is called without ``include``.
+            tree_backend str: either ``sklearn`` or ``numba``. If ``numba``, the
+                DecisionTreeRegressor is replaced by a numba compiled regression tree.
             model_kwargs dict: keyword arguments which are to be passed to `Model`
                 and are not optimized.
 
@@ -92,26 +277,17 @@ class MLRegressionExperiments(Experiments):
         self.param_space = param_space
         self.x0 = x0
         self.model_kws = model_kwargs
+        self.include_slow = include_slow
+        self.tree_backend = tree_backend
 
         if exp_name == "MLRegressionExperiments":
             exp_name = f"{exp_name}_{dateandtime_now()}"
 
         super().__init__(cases=cases, exp_name=exp_name, num_samples=num_samples, verbosity=verbosity)
 
-        self.spaces = regression_space(num_samples=num_samples)
+        self.spaces = _cached_regression_space(num_samples)
 
-        if catboost is None:
-            self.models.remove('model_CatBoostRegressor')
-        if lightgbm is None:
-            self.models.remove('model_LGBMRegressor')
-        if xgboost is None:
-            self.models.remove('model_XGBRFRegressor')
-
-        sk_maj_ver = int(sklearn.__version__.split('.')[0])
-        sk_min_ver = int(sklearn.__version__.split('.')[1])
-        if sk_maj_ver == 0 and sk_min_ver < 23:
-            for m in ['model_PoissonRegressor', 'model_TweedieRegressor']:
-                self.models.remove(m)
+        self.models = [m for m in self.models if m not in _UNAVAILABLE]
 
     @property
     def tpot_estimator(self):
@@ -125,60 +301,6 @@ class MLRegressionExperiments(Experiments):
     def mode(self):
         return "regression"
 
-    def model_AdaBoostRegressor(self, **kwargs):
-        # https://scikit-learn.org/stable/modules/generated/sklearn.ensemble.AdaBoostRegressor.html
-
-        self.path = "sklearn.ensemble.AdaBoostRegressor"
-        self.param_space = self.spaces["AdaBoostRegressor"]["param_space"]
-        self.x0 = self.spaces["AdaBoostRegressor"]["x0"]
-
-        return {'model': {'AdaBoostRegressor': kwargs}}
-
-    def model_ARDRegression(self, **kwargs):
-        # https://scikit-learn.org/stable/modules/generated/sklearn.linear_model.ARDRegression.html
-
-        self.path = "sklearn.linear_model.ARDRegression"
-        self.param_space = self.spaces["ARDRegression"]["param_space"]
-        self.x0 = self.spaces["ARDRegression"]["x0"]
-
-        return {'model': {'ARDRegression': kwargs}}
-
-    def model_BaggingRegressor(self, **kwargs):
-
-        self.path = "sklearn.ensemble.BaggingRegressor"
-        self.param_space = self.spaces["BaggingRegressor"]["param_space"]
-        self.x0 = self.spaces["BaggingRegressor"]["x0"]
-
-        return {'model': {'BaggingRegressor': kwargs}}
-
-    def model_BayesianRidge(self, **kwargs):
-        # https://scikit-learn.org/stable/modules/generated/sklearn.linear_model.BayesianRidge.html
-
-        self.path = "sklearn.linear_model.BayesianRidge"
-        self.param_space = self.spaces["BayesianRidge"]["param_space"]
-        self.x0 = self.spaces["BayesianRidge"]["x0"]
-
-        return {'model': {'BayesianRidge': kwargs}}
-
-    def model_CatBoostRegressor(self, **kwargs):
-        # https://catboost.ai/docs/concepts/python-reference_parameters-list.html
-
-        self.path = "catboost.CatBoostRegressor"
-        self.param_space = self.spaces["CatBoostRegressor"]["param_space"]
-        self.x0 = self.spaces["CatBoostRegressor"]["x0"]
-
-        return {'model': {'CatBoostRegressor': kwargs}}
-
-    def model_DecisionTreeRegressor(self, **kwargs):
-        # https://scikit-learn.org/stable/modules/generated/sklearn.tree.DecisionTreeRegressor.html
-
-        self.path = "sklearn.tree.DecisionTreeRegressor"
-        # TODO not converging
-        self.param_space = self.spaces["DecisionTreeRegressor"]["param_space"]
-        self.x0 = self.spaces["DecisionTreeRegressor"]["x0"]
-
-        return {'model': {'DecisionTreeRegressor': kwargs}}
-
     def model_DummyRegressor(self, **kwargs):
         # https://scikit-learn.org/stable/modules/generated/sklearn.dummy.DummyRegressor.html
 
@@ -190,42 +312,6 @@ class MLRegressionExperiments(Experiments):
 
         return {'model': {'DummyRegressor': kwargs}}
 
-    def model_ElasticNet(self, **kwargs):
-        # https://scikit-learn.org/stable/modules/generated/sklearn.linear_model.ElasticNet.html
-
-        self.path = "sklearn.linear_model.ElasticNet"
-        self.param_space = self.spaces["ElasticNet"]["param_space"]
-        self.x0 = self.spaces["ElasticNet"]["x0"]
-
-        return {'model': {'ElasticNet': kwargs}}
-
-    def model_ElasticNetCV(self, **kwargs):
-        # https://scikit-learn.org/stable/modules/generated/sklearn.linear_model.ElasticNetCV.html
-
-        self.path = "sklearn.linear_model.ElasticNetCV"
-        self.param_space = self.spaces["ElasticNetCV"]["param_space"]
-        self.x0 = self.spaces["ElasticNetCV"]["x0"]
-
-        return {'model': {'ElasticNetCV': kwargs}}
-
-    def model_ExtraTreeRegressor(self, **kwargs):
-        # https://scikit-learn.org/stable/modules/generated/sklearn.tree.ExtraTreeRegressor.htm
-
-        self.path = "sklearn.tree.ExtraTreeRegressor"
-        self.param_space = self.spaces["ExtraTreeRegressor"]["param_space"]
-        self.x0 = self.spaces["ExtraTreeRegressor"]["x0"]
-
-        return {'model': {'ExtraTreeRegressor': kwargs}}
-
-    def model_ExtraTreesRegressor(self, **kwargs):
-        # https://scikit-learn.org/stable/modules/generated/sklearn.ensemble.ExtraTreesRegressor.html
-
-        self.path = "sklearn.ensemble.ExtraTreesRegressor"
-        self.param_space = self.spaces["ExtraTreesRegressor"]["param_space"]
-        self.x0 = self.spaces["ExtraTreesRegressor"]["x0"]
-
-        return {'model': {'ExtraTreesRegressor': kwargs}}
-
     # def model_GammaRegressor(self, **kwargs):
     # https://scikit-learn.org/stable/modules/generated/sklearn.linear_model.GammaRegressor.html?highlight=gammaregressor
     #     self.param_space = [
@@ -238,268 +324,6 @@ class MLRegressionExperiments(Experiments):
     #     self.x0 = [0.5, 100,1e-6, True, True]
     #     return {'model': {'GammaRegressor': kwargs}}
 
-    def model_GaussianProcessRegressor(self, **kwargs):
-        # https://scikit-learn.org/stable/modules/generated/sklearn.gaussian_process.GaussianProcessRegressor.html
-
-        self.path = "sklearn.gaussian_process.GaussianProcessRegressor"
-        self.param_space = self.spaces["GaussianProcessRegressor"]["param_space"]
-        self.x0 = self.spaces["GaussianProcessRegressor"]["x0"]
-
-        return {'model': {'GaussianProcessRegressor': kwargs}}
-
-    def model_GradientBoostingRegressor(self, **kwargs):
-        # https://scikit-learn.org/stable/modules/generated/sklearn.ensemble.GradientBoostingRegressor.html
-
-        self.path = "sklearn.ensemble.GradientBoostingRegressor"
-        self.param_space = self.spaces["GradientBoostingRegressor"]["param_space"]
-        self.x0 = self.spaces["GradientBoostingRegressor"]["x0"]
-
-        return {'model': {'GradientBoostingRegressor': kwargs}}
-
-    def model_HistGradientBoostingRegressor(self, **kwargs):
-        # https://scikit-learn.org/stable/modules/generated/sklearn.ensemble.HistGradientBoostingRegressor.html
-
-        # TODO not hpo not converging
-        self.path = "sklearn.ensemble.HistGradientBoostingRegressor"
-        self.param_space = self.spaces["HistGradientBoostingRegressor"]["param_space"]
-        self.x0 = self.spaces["HistGradientBoostingRegressor"]["x0"]
-
-        return {'model': {'HistGradientBoostingRegressor':kwargs}}
-
-    def model_HuberRegressor(self, **kwargs):
-        # https://scikit-learn.org/stable/modules/generated/sklearn.linear_model.HuberRegressor.html
-
-        self.path = "sklearn.linear_model.HuberRegressor"
-        self.param_space = self.spaces["HuberRegressor"]["param_space"]
-        self.x0 = self.spaces["HuberRegressor"]["x0"]
-
-        return {'model': {'HuberRegressor': kwargs}}
-
-    def model_KernelRidge(self, **kwargs):
-        # https://scikit-learn.org/stable/modules/generated/sklearn.kernel_ridge.KernelRidge.html
-
-        self.path = "sklearn.kernel_ridge.KernelRidge"
-        self.param_space = self.spaces["KernelRidge"]["param_space"]
-        self.x0 = self.spaces["KernelRidge"]["x0"]
-
-        return {'model': {'KernelRidge': kwargs}}
-
-    def model_KNeighborsRegressor(self, **kwargs):
-        # https://scikit-learn.org/stable/modules/generated/sklearn.neighbors.KNeighborsRegressor.html
-
-        self.path = "sklearn.neighbors.KNeighborsRegressor"
-        self.param_space = self.spaces["KNeighborsRegressor"]["param_space"]
-        self.x0 = self.spaces["KNeighborsRegressor"]["x0"]
-
-        return {'model': {'KNeighborsRegressor': kwargs}}
-
-    def model_LassoLars(self, **kwargs):
-        # https://scikit-learn.org/stable/modules/generated/sklearn.linear_model.LassoLars.html
-
-        self.path = "sklearn.linear_model.LassoLars"
-        self.param_space = self.spaces["LassoLars"]["param_space"]
-        self.x0 = self.spaces["LassoLars"]["x0"]
-
-        return {'model': {'LassoLars': kwargs}}
-
-    def model_Lars(self, **kwargs):
-        # https://scikit-learn.org/stable/modules/generated/sklearn.linear_model.Lars.html
-
-        self.path = "sklearn.linear_model.Lars"
-        self.param_space = self.spaces["Lars"]["param_space"]
-        self.x0 = self.spaces["Lars"]["x0"]
-
-        return {'model': {'Lars': kwargs}}
-
-    def model_LarsCV(self, **kwargs):
-        # https://scikit-learn.org/stable/modules/generated/sklearn.linear_model.LarsCV.html
-
-        self.path = "sklearn.linear_model.LarsCV"
-        self.param_space = self.spaces["LarsCV"]["param_space"]
-        self.x0 = self.spaces["LarsCV"]["x0"]
-
-        return {'model': {'LarsCV': kwargs}}
-
-    def model_LinearSVR(self, **kwargs):
-        # https://scikit-learn.org/stable/modules/generated/sklearn.svm.LinearSVR.html
-
-        self.path = "sklearn.svm.LinearSVR"
-        self.param_space = self.spaces["LinearSVR"]["param_space"]
-        self.x0 = self.spaces["LinearSVR"]["x0"]
-
-        return {'model': {'LinearSVR': kwargs}}
-
-    def model_Lasso(self, **kwargs):
-        # https://scikit-learn.org/stable/modules/generated/sklearn.linear_model.Lasso.html
-
-        self.path = "sklearn.linear_model.Lasso"
-        self.param_space = self.spaces["Lasso"]["param_space"]
-        self.x0 = self.spaces["Lasso"]["x0"]
-
-        return {'model': {'Lasso': kwargs}}
-
-    def model_LassoCV(self, **kwargs):
-        # https://scikit-learn.org/stable/modules/generated/sklearn.linear_model.LassoCV.html
-
-        self.path = "sklearn.linear_model.LassoCV"
-        self.param_space = self.spaces["LassoCV"]["param_space"]
-        self.x0 = self.spaces["LassoCV"]["x0"]
-
-        return {'model': {'LassoCV': kwargs}}
-
-    def model_LassoLarsCV(self, **kwargs):
-        # https://scikit-learn.org/stable/modules/generated/sklearn.linear_model.LassoLarsCV.html
-
-        self.path = "sklearn.linear_model.LassoLarsCV"
-        self.param_space = self.spaces["LassoLarsCV"]["param_space"]
-        self.x0 = self.spaces["LassoLarsCV"]["x0"]
-
-        return {'model': {'LassoLarsCV': kwargs}}
-
-    def model_LassoLarsIC(self, **kwargs):
-        # https://scikit-learn.org/stable/modules/generated/sklearn.linear_model.LassoLarsIC.html
-
-        self.path = "sklearn.linear_model.LassoLarsIC"
-        self.param_space = self.spaces["LassoLarsIC"]["param_space"]
-        self.x0 = self.spaces["LassoLarsIC"]["x0"]
-
-        return {'model': {'LassoLarsIC': kwargs}}
-
-    def model_LGBMRegressor(self, **kwargs):
-        # https://lightgbm.readthedocs.io/en/latest/pythonapi/lightgbm.LGBMRegressor.html
-
-        self.path = "lightgbm.LGBMRegressor"
-        self.param_space = self.spaces["LGBMRegressor"]["param_space"]
-        self.x0 = self.spaces["LGBMRegressor"]["x0"]
-
-        return {'model': {'LGBMRegressor': kwargs}}
-
-    def model_LinearRegression(self, **kwargs):
-        # https://scikit-learn.org/stable/modules/generated/sklearn.linear_model.LinearRegression.html
-
-        self.path = "sklearn.linear_model.LinearRegression"
-        self.param_space = self.spaces["LinearRegression"]["param_space"]
-        self.x0 = self.spaces["LinearRegression"]["x0"]
-
-        return {'model': {'LinearRegression': kwargs}}
-
-    def model_MLPRegressor(self, **kwargs):
-        # https://scikit-learn.org/stable/modules/generated/sklearn.neural_network.MLPRegressor.html
-
-        self.path = "sklearn.neural_network.MLPRegressor"
-        self.param_space = self.spaces["MLPRegressor"]["param_space"]
-        self.x0 = self.spaces["MLPRegressor"]["x0"]
-
-        return {'model': {'MLPRegressor': kwargs}}
-
-    def model_NuSVR(self, **kwargs):
-        # https://scikit-learn.org/stable/modules/generated/sklearn.svm.NuSVR.html
-
-        self.path = "sklearn.svm.NuSVR"
-        self.param_space = self.spaces["NuSVR"]["param_space"]
-        self.x0 = self.spaces["NuSVR"]["x0"]
-
-        return {'model': {'NuSVR': kwargs}}
-
-    def model_OrthogonalMatchingPursuit(self, **kwargs):
-        # https://scikit-learn.org/stable/modules/generated/sklearn.linear_model.OrthogonalMatchingPursuit.html
-
-        self.path = "sklearn.linear_model.OrthogonalMatchingPursuit"
-        self.param_space = self.spaces["OrthogonalMatchingPursuit"]["param_space"]
-        self.x0 = self.spaces["OrthogonalMatchingPursuit"]["x0"]
-
-        return {'model': {'OrthogonalMatchingPursuit': kwargs}}
-
-    def model_OrthogonalMatchingPursuitCV(self, **kwargs):
-        # https://scikit-learn.org/stable/modules/generated/sklearn.linear_model.OrthogonalMatchingPursuitCV.html
-
-        self.path = "sklearn.linear_model.OrthogonalMatchingPursuitCV"
-        self.param_space = self.spaces["OrthogonalMatchingPursuitCV"]["param_space"]
-        self.x0 = self.spaces["OrthogonalMatchingPursuitCV"]["x0"]
-
-        return {'model': {'OrthogonalMatchingPursuitCV': kwargs}}
-
-    def model_OneClassSVM(self, **kwargs):
-        # https://scikit-learn.org/stable/modules/generated/sklearn.svm.OneClassSVM.html
-
-        self.path = "sklearn.svm.OneClassSVM"
-        self.param_space = self.spaces["OneClassSVM"]["param_space"]
-        self.x0 = self.spaces["OneClassSVM"]["x0"]
-
-        return {'model': {'OneClassSVM': kwargs}}
-
-    def model_PoissonRegressor(self, **kwargs):
-        # https://scikit-learn.org/stable/modules/generated/sklearn.linear_model.PoissonRegressor.html
-
-        self.path = "sklearn.linear_model.PoissonRegressor"
-        self.param_space = self.spaces["PoissonRegressor"]["param_space"]
-        self.x0 = self.spaces["PoissonRegressor"]["x0"]
-
-        return {'model': {'PoissonRegressor': kwargs}}
-
-    def model_Ridge(self, **kwargs):
-        # https://scikit-learn.org/stable/modules/generated/sklearn.linear_model.Ridge.html
-
-        self.path = "sklearn.linear_model.Ridge"
-        self.param_space = self.spaces["Ridge"]["param_space"]
-        self.x0 = self.spaces["Ridge"]["x0"]
-
-        return {'model': {'Ridge': kwargs}}
-
-    def model_RidgeCV(self, **kwargs):
-        # https://scikit-learn.org/stable/modules/generated/sklearn.linear_model.RidgeCV.html
-
-        self.path = "sklearn.linear_model.RidgeCV"
-        self.param_space = self.spaces["RidgeCV"]["param_space"]
-        self.x0 = self.spaces["RidgeCV"]["x0"]
-
-        return {'model': {'RidgeCV': kwargs}}
-
-    def model_RadiusNeighborsRegressor(self, **kwargs):
-        # https://scikit-learn.org/stable/modules/generated/sklearn.neighbors.RadiusNeighborsRegressor.html
-
-        self.path = "sklearn.neighbors.RadiusNeighborsRegressor"
-        self.param_space = self.spaces["RadiusNeighborsRegressor"]["param_space"]
-        self.x0 = self.spaces["RadiusNeighborsRegressor"]["x0"]
-
-        return {'model': {'RadiusNeighborsRegressor': kwargs}}
-
-    def model_RANSACRegressor(self, **kwargs):
-        # https://scikit-learn.org/stable/modules/generated/sklearn.linear_model.RANSACRegressor.html
-
-        self.path = "sklearn.linear_model.RANSACRegressor"
-        self.param_space = self.spaces["RANSACRegressor"]["param_space"]
-        self.x0 = self.spaces["RANSACRegressor"]["x0"]
-
-        return {'model': {'RANSACRegressor': kwargs}}
-
-    def model_RandomForestRegressor(self, **kwargs):
-        # https://scikit-learn.org/stable/modules/generated/sklearn.ensemble.RandomForestRegressor.html
-
-        self.path = "sklearn.ensemble.RandomForestRegressor"
-        self.param_space = self.spaces["RandomForestRegressor"]["param_space"]
-        self.x0 = self.spaces["RandomForestRegressor"]["x0"]
-
-        return {'model': {'RandomForestRegressor': kwargs}}
-
-    def model_SVR(self, **kwargs):
-        # https://scikit-learn.org/stable/modules/generated/sklearn.svm.SVR.html
-
-        self.path = "sklearn.svm.SVR"
-        self.param_space = self.spaces["SVR"]["param_space"]
-        self.x0 = self.spaces["SVR"]["x0"]
-
-        return {'model': {'SVR': kwargs}}
-
-    def model_SGDRegressor(self, **kwargs):
-        # https://scikit-learn.org/stable/modules/generated/sklearn.linear_model.SGDRegressor.html
-
-        self.path = "sklearn.linear_model.SGDRegressor"
-        self.param_space = self.spaces["SGDRegressor"]["param_space"]
-        self.x0 = self.spaces["SGDRegressor"]["x0"]
-
-        return {'model': {'SGDRegressor': kwargs}}
-
     # def model_TransformedTargetRegressor(self, **kwargs):
     #     ## https://scikit-learn.org/stable/modules/generated/sklearn.compose.TransformedTargetRegressor.html
     #     self.param_space = [
@@ -510,14 +334,21 @@ class MLRegressionExperiments(Experiments):
     #     self.x0 = [None, None, None]
     #     return {'model': {'TransformedTargetRegressor': kwargs}}
 
-    def model_TweedieRegressor(self, **kwargs):
-        # https://scikit-learn.org/stable/modules/generated/sklearn.linear_model.TweedieRegressor.html
+    def model_DecisionTreeRegressor(self, **kwargs):
+        # https://scikit-learn.org/stable/modules/generated/sklearn.tree.DecisionTreeRegressor.html
+
+        self.path = "sklearn.tree.DecisionTreeRegressor"
+        self.param_space = self.spaces["DecisionTreeRegressor"]["param_space"]
+        self.x0 = self.spaces["DecisionTreeRegressor"]["x0"]
 
-        self.path = "sklearn.linear_model.TweedieRegressor"
-        self.param_space = self.spaces["TweedieRegressor"]["param_space"]
-        self.x0 = self.spaces["TweedieRegressor"]["x0"]
+        if kwargs.pop('backend', self.tree_backend) == 'numba':
+            # numba tree only has the 'best' splitter
+            self.path = "ai4water.experiments._numba_tree.NumbaDecisionTreeRegressor"
+            self.param_space = self.param_space[1:]
+            self.x0 = self.x0[1:]
+            return {'model': {'_NumbaDecisionTreeRegressor': kwargs}}
 
-        return {'model': {'TweedieRegressor': kwargs}}
+        return {'model': {'DecisionTreeRegressor': kwargs}}
 
     def model_TheilsenRegressor(self, **kwargs):
         # https://scikit-learn.org/stable/modules/generated/sklearn.linear_model.TheilSenRegressor.html
@@ -525,6 +356,7 @@ class MLRegressionExperiments(Experiments):
         self.path = "sklearn.linear_model.TheilSenRegressor"
         self.param_space = self.spaces["TheilSenRegressor"]["param_space"]
         self.x0 = self.spaces["TheilSenRegressor"]["x0"]
+        kwargs.setdefault('n_jobs', -1)
 
         return {'model': {'TheilSenRegressor': kwargs}}
 
@@ -533,20 +365,8 @@ class MLRegressionExperiments(Experiments):
     #     # ValueError: Some value(s) of y are out of the valid range for family GammaDistribution
     #     return {'GAMMAREGRESSOR': {}}
 
-    def model_XGBRFRegressor(self, **kwargs):
-        # https://xgboost.readthedocs.io/en/latest/python/python_api.html#xgboost.XGBRFRegressor
-
-        self.path = "xgboost.XGBRFRegressor"
-        self.param_space = self.spaces["XGBRFRegressor"]["param_space"]
-        self.x0 = self.spaces["XGBRFRegressor"]["x0"]
-
-        return {'model': {'XGBRFRegressor': kwargs}}
-
-    def model_XGBRegressor(self, **kwargs):
-        # ##https://xgboost.readthedocs.io/en/latest/python/python_api.html#xgboost.XGBRegressor
-
-        self.path = "xgboost.XGBRegressor"
-        self.param_space = self.spaces["XGBRegressor"]["param_space"]
-        self.x0 = self.spaces["XGBRegressor"]["x0"]
 
-        return {'model': {'XGBRegressor': kwargs}}
+for _name, _path in _MODELS.items():
+    setattr(MLRegressionExperiments, f"model_{_name}",
+            _model_method(_name, _path, defaults=_DEFAULTS.get(_name)))
+del _name, _path
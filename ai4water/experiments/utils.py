@@ -1,4 +1,5 @@
 import sys
+from typing import Union, Callable
 
 from ai4water.hyperopt import Integer, Real, Categorical
 
@@ -832,3 +833,25 @@ def regression_models()->list:
 def classification_models()->list:
     """returns availabel classification models as list"""
     return list(classification_space(5,0).keys())
+
+
+def _model_method(name: str, path: str, space: str = None, defaults: Union[dict, Callable] = None):
+    """makes the ``model_<name>`` method of an Experiments class. The method
+    sets ``path``, ``param_space`` and ``x0`` from ``self.spaces[space]``
+    and returns the config of model ``name``. ``defaults`` are the arguments
+    of the model which are used unless given by the caller. It can also be
+    a function which returns these arguments when the method is called."""
+    space = space or name
+    defaults = defaults or {}
+
+    def model(self, **kwargs):
+        spec = self.spaces[space]
+        self.path = path
+        self.param_space = spec["param_space"]
+        self.x0 = spec["x0"]
+
+        _defaults = defaults() if callable(defaults) else defaults
+        return {'model': {name: {**_defaults, **kwargs}}}
+
+    model.__name__ = f"model_{name}"
+    return model
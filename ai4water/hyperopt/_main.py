@@ -1,38 +1,46 @@
 import os
+import re
 import json
+import pickle
+import shelve
+import threading
 import copy
 import inspect
 import warnings
 from typing import Union
+from functools import partial
 from collections import OrderedDict
 
 import sklearn
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-from easy_mpl import parallel_coordinates, hist
 from sklearn.model_selection import GridSearchCV, RandomizedSearchCV
 from sklearn.model_selection import ParameterGrid, ParameterSampler
+import joblib
+from joblib import Parallel, delayed, effective_n_jobs
 
 try:
     import plotly
 except ImportError:
     plotly = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 try:
     import skopt
-    from skopt import gp_minimize
+    from skopt import gp_minimize, forest_minimize, gbrt_minimize, Optimizer
     from skopt import BayesSearchCV
-    from skopt.space.space import Space
-    from skopt.utils import use_named_args
-    from skopt.space.space import Dimension
-    from skopt.plots import plot_convergence, plot_evaluations
+    from skopt.space.space import Space, Dimension
+    from skopt.utils import use_named_args, cook_estimator
 except ImportError:
-    skopt, gp_minimize, BayesSearchCV, Space, _Real, use_named_args = None, None, None, None, None, None
-    Dimension, _Integer, _Categorical, plot_evaluations, plot_convergence = None, None, None, None, None
+    skopt, gp_minimize, forest_minimize, gbrt_minimize, BayesSearchCV = None, None, None, None, None
+    Space, Dimension, use_named_args = None, None, None
 
-if skopt is not None:
-    from skopt import forest_minimize
+_SKLEARN_VERSION = tuple(int(v) for v in sklearn.__version__.split('.')[:2])
+_SKOPT_VERSION = None if skopt is None else tuple(int(v) for v in skopt.__version__.split('.')[:2])
 
 try:
     import hyperopt
@@ -94,6 +102,17 @@ ALGORITHMS = {
 }
 
 
+def _invalid_space(space):
+    raise AssertionError(f"""
+            param space must be one of Integer, Real or Categorical
+            but it is of type {space.__class__.__name__}""")
+
+
+def _forward_to_optfn(attr: str) -> property:
+    return property(lambda self: getattr(self.optfn, attr),
+                    doc=f"``{attr}`` of the underlying sklearn/skopt search object")
+
+
 class HyperOpt(object):
     """
     The purpose of this class is to provide a uniform and simplifed interface to
@@ -290,6 +309,11 @@ class HyperOpt(object):
             opt_path: str = None,
             process_results: bool = True,
             verbosity: int = 1,
+            surrogate: str = None,
+            warm_start: bool = False,
+            use_cache: bool = True,
+            persist_cache: bool = False,
+            parallel_backend: str = "loky",
             **kwargs
     ):
         """
@@ -325,6 +349,43 @@ class HyperOpt(object):
                 or `sklearn` for `grid` algorithm.
             verbosity : bool, optional
                 determines amount of information being printed
+            surrogate : str, optional
+                surrogate model to be used by skopt for ``bayes`` algorithm. It
+                can be ``gp`` (gp_minimize), ``forest`` (forest_minimize) or ``gbrt``
+                (gbrt_minimize). By default ``gp`` is used and for ``bayes_rf``,
+                ``forest`` is used. Since the cost of fitting gaussian process grows
+                cubically with the number of iterations, ``gbrt`` or ``forest`` can
+                be much faster when the number of iterations is large e.g. above 100.
+            warm_start : bool, optional
+                only for ``bayes`` and ``bayes_rf`` algorithms. The evaluated points
+                of every run are saved in ``warm_start.pkl`` in the parent directory
+                of ``opt_path``. If True, the points saved by a previous run with
+                the same parameter names, which lie inside the current parameter
+                space, are used as ``x0`` and ``y0``.
+            use_cache : bool, optional
+                If True (default), the error of every evaluated set of parameters
+                is stored and objective_fn is not called again when the optimizer
+                suggests the same parameters. Set it to False if the objective_fn
+                is not deterministic.
+            persist_cache : bool, optional
+                If True, the stored errors are saved in ``eval_cache`` file in
+                ``opt_path``, so that a later run with the same ``opt_path`` does
+                not evaluate these parameters again. The saved errors are used only
+                if the objective_fn, the parameter space and the data, which the
+                objective_fn refers to, are unchanged. This is checked by hashing
+                them, therefore objective_fn should be a function whose data can be
+                pickled. Every evaluation is also appended to ``eval_results.jsonl``
+                file in ``opt_path``, so that the errors of an interrupted run are
+                used by the next run. Default is False.
+            parallel_backend : str, optional
+                joblib backend which evaluates objective_fn when ``n_jobs`` is not 1.
+                The default ``loky`` runs the evaluations in separate processes, which
+                requires pickling objective_fn along with the data it refers to. If
+                objective_fn releases the GIL e.g. numpy or xgboost based models,
+                ``threading`` avoids this pickling. For ``bayes`` and ``bayes_rf``
+                algorithms, ``n_jobs`` points are asked at once from skopt's Optimizer
+                (constant liar strategy) and evaluated in parallel. Therefore the
+                search follows a different path and its result depends upon ``n_jobs``.
             **kwargs :
                 Any additional keyword arguments will for the underlying optimization
                 algorithm. In case of using AI4Water model, these must be arguments
@@ -338,17 +399,43 @@ class HyperOpt(object):
         self.objective_fn = objective_fn
         self.algorithm = algorithm
         self.backend = backend
+
+        # decide only once which library does the optimization
+        is_sklearn = "sklearn" in type(objective_fn).__module__
+        # whether to use sklearn's GridSearchCV or RandomSearchCV
+        self.use_sklearn = self.algorithm in ["random", "grid"] and is_sklearn
+        # whether to use skopt based BayesSearchCV
+        self.use_skopt_bayes = self.algorithm in ["bayes", "bayes_rf"] and is_sklearn
+        # whether to use skopt based gp_minimize function. This is to implement Bayesian on
+        # non-sklearn based models
+        self.use_skopt_gpmin = self.algorithm in ["bayes", "bayes_rf"] and not is_sklearn
+        self.use_tpe = self.algorithm in ['tpe', 'atpe', 'random'] and self.backend == 'hyperopt'
+        # whether we have to build our own optimization method.
+        self.use_own = not self.use_sklearn and not self.use_skopt_bayes and not self.use_skopt_gpmin
         self.param_space = param_space
         self.original_space = param_space       # todo self.space and self.param_space should be combined.
+        self._names = None  # names of parameters in original_space
+        self._spaces = {}  # original_space after conversion
         self.title = self.algorithm
         self.results = {}  # internally stored results
+        self._trial_cache = {}  # error of already evaluated parameters
+        self._run_trials = {}  # error of parameters evaluated or looked up during current fit
+        self._run_paras = {}  # parameters of _run_trials as given to objective_fn, keys are rounded
+        self.use_cache = use_cache
+        self.parallel_backend = parallel_backend
         self.gpmin_results = None  #
         self.data = None
         self.eval_on_best = eval_on_best
         self.opt_path = opt_path
+        self.persist_cache = persist_cache
+        self._fingerprint = None  # of objective_fn, param_space and data of saved errors
+        self._results_fp = None  # eval_results.jsonl, open during fit if errors are saved
         self._process_results = process_results
         self.objective_fn_is_dl = False
         self.verbosity = verbosity
+        assert surrogate in (None, 'gp', 'forest', 'gbrt'), f"invalid surrogate {surrogate}"
+        self.surrogate = surrogate
+        self.warm_start = warm_start
 
         self.gpmin_args = self.check_args(**kwargs)
 
@@ -421,7 +508,7 @@ Backend must be one of hyperopt, optuna or sklearn but is is {x}"""
         kwargs = copy.deepcopy(kwargs)
 
         if 'n_initial_points' in kwargs:
-            if int(''.join(skopt.__version__.split('.')[1])) < 8:
+            if _SKOPT_VERSION < (0, 8):
                 raise ValueError(f"""
                         'n_initial_points' argument is not available in skopt version < 0.8.
                         However you are using skopt version {skopt.__version__} .
@@ -438,11 +525,22 @@ Backend must be one of hyperopt, optuna or sklearn but is is {x}"""
         # Since it was not possible to inherit this class from BaseSearchCV and BayesSearchCV at the same time, this
         # hack makes sure that all the functionalities of GridSearchCV, RandomizeSearchCV and BayesSearchCV are also
         # available with class.
-        if self.use_sklearn or self.use_skopt_bayes:
+        # self.__dict__ is used because the attributes may not be set yet
+        if self.__dict__.get('use_sklearn') or self.__dict__.get('use_skopt_bayes'):
             return getattr(self.optfn, item)
         else:
             raise AttributeError(f"HyperOpt does not have attribute {item}")
 
+    # the most frequently used attributes of fitted optfn are forwarded directly
+    # instead of going through __getattr__
+    best_params_ = _forward_to_optfn("best_params_")
+    best_score_ = _forward_to_optfn("best_score_")
+    best_estimator_ = _forward_to_optfn("best_estimator_")
+    best_index_ = _forward_to_optfn("best_index_")
+    cv_results_ = _forward_to_optfn("cv_results_")
+    n_splits_ = _forward_to_optfn("n_splits_")
+    scorer_ = _forward_to_optfn("scorer_")
+
     @property
     def param_space(self):
         return self._param_space
@@ -463,23 +561,17 @@ Backend must be one of hyperopt, optuna or sklearn but is is {x}"""
                 assert isinstance(x, list), f"""
                         param space must be list of parameters but it is of type
                         {x.__class__.__name__}"""
-                for space in x:
-                    # each element in the list can be a tuple of lower and and upper bounds
-                    if not isinstance(space, tuple):
-                        assert isinstance(space, Dimension), f"""
-                                param space must be one of Integer, Real or Categorical
-                                but it is of type {space.__class__.__name__}"""
-                _param_space = x
+                # each element in the list can be a tuple of lower and and upper bounds
+                _param_space = [space if isinstance(space, (Dimension, tuple)) else _invalid_space(space)
+                                for space in x]
 
         elif self.algorithm in ["random", "grid"] and self.backend != 'optuna':
             # todo, do we also need to provide grid of sample space for random??
             if isinstance(x, dict):
                 _param_space = x
             elif isinstance(x, list):
-                _param_space = {}
-                for _space in x:
-                    assert isinstance(_space, Dimension)
-                    _param_space[_space.name] = _space.grid
+                _param_space = {_space.name: _space.grid if isinstance(_space, Dimension) else _invalid_space(_space)
+                                for _space in x}
             else:
                 raise ValueError
         elif self.algorithm in ['tpe', 'atpe', 'random'] and self.backend == 'hyperopt':
@@ -521,50 +613,16 @@ Backend must be one of hyperopt, optuna or sklearn but is is {x}"""
 
     def skopt_space(self):
         """Tries to make skopt compatible Space object. If unsuccessful, return None"""
-        return to_skopt_space(self.original_space)
+        # original_space does not change so it is converted and validated only once
+        if 'skopt' not in self._spaces:
+            self._spaces['skopt'] = to_skopt_space(self.original_space)
+        return self._spaces['skopt']
 
     def space(self) -> dict:
         """Returns a skopt compatible space but as dictionary"""
-        return to_skopt_as_dict(self.algorithm, self.backend, self.original_space)
-
-    @property
-    def use_sklearn(self):
-        # will return True if we are to use sklearn's GridSearchCV or RandomSearchCV
-        if self.algorithm in ["random", "grid"] and "sklearn" in str(type(self.objective_fn)):
-            return True
-        return False
-
-    @property
-    def use_skopt_bayes(self):
-        # will return true if we have to use skopt based BayesSearchCV
-        if self.algorithm in ["bayes", "bayes_rf"] and "sklearn" in str(type(self.objective_fn)):
-            assert not self.use_sklearn
-            return True
-        return False
-
-    @property
-    def use_skopt_gpmin(self):
-        # will return True if we have to use skopt based gp_minimize function. This is to implement Bayesian on
-        # non-sklearn based models
-        if self.algorithm in ["bayes", "bayes_rf"] and "sklearn" not in str(type(self.objective_fn)):
-            assert not self.use_sklearn
-            assert not self.use_skopt_bayes
-            return True
-        return False
-
-    @property
-    def use_tpe(self):
-        if self.algorithm in ['tpe', 'atpe', 'random'] and self.backend == 'hyperopt':
-            return True
-        else:
-            return False
-
-    @property
-    def use_own(self):
-        # return True, we have to build our own optimization method.
-        if not self.use_sklearn and not self.use_skopt_bayes and not self.use_skopt_gpmin:
-            return True
-        return False
+        if 'dict' not in self._spaces:
+            self._spaces['dict'] = to_skopt_as_dict(self.algorithm, self.backend, self.original_space)
+        return self._spaces['dict']
 
     @property
     def random_state(self):
@@ -617,8 +675,7 @@ Backend must be one of hyperopt, optuna or sklearn but is is {x}"""
         # returns best parameters either as dictionary or as list
         if self.use_skopt_gpmin:
             d = self.xy_of_iterations()
-            k = list(dict(sorted(d.items())).keys())[0]
-            paras = d[k]
+            paras = d[min(d, key=_key_error)]
         elif self.backend == 'hyperopt':
             d = get_one_tpe_x_iter(self.trials.best_trial['misc']['vals'], self.hp_space())
             if as_list:
@@ -632,8 +689,14 @@ Backend must be one of hyperopt, optuna or sklearn but is is {x}"""
         elif self.use_skopt_bayes or self.use_sklearn:
             paras = self.optfn.best_params_
         else:
-            best_y = list(sorted(self.results.keys()))[0]
-            paras = sort_x_iters(self.results[best_y], list(self.param_space.keys()))
+            if self._run_trials:
+                # the keys of self.results are shifted by the index of the iteration
+                # and self._trial_cache may contain parameters of previous runs
+                best = min(self._run_trials, key=self._run_trials.get)
+                paras = sort_x_iters(dict(self._run_paras[best]), list(self.param_space.keys()))
+            else:
+                best_y = min(self.results, key=_key_error)
+                paras = sort_x_iters(self.results[best_y], list(self.param_space.keys()))
 
         if as_list:
             return list(paras.values())
@@ -641,6 +704,18 @@ Backend must be one of hyperopt, optuna or sklearn but is is {x}"""
 
     def fit(self, *args, **kwargs):
         """Makes and calls the underlying fit method"""
+        self._run_trials = {}
+        self._run_paras = {}
+        if self.persist_cache:
+            self._fingerprint = _fingerprint(self.objective_fn, self.param_space, self.data)
+            if self._fingerprint is None:
+                warnings.warn("""errors of trials are not saved because objective_fn,
+                param_space or data could not be hashed""")
+            else:
+                self._load_disk_cache()
+                # each trial is appended as soon as it is evaluated, so that the
+                # results of an interrupted run are not lost
+                self._results_fp = open(os.path.join(self.opt_path, "eval_results.jsonl"), "a", buffering=1)
 
         if self.use_sklearn or self.use_skopt_bayes:
             fit_fn = self.optfn.fit
@@ -649,7 +724,7 @@ Backend must be one of hyperopt, optuna or sklearn but is is {x}"""
             fit_fn = self.own_fit
 
         elif self.use_own:
-            self.predict = self._predict
+            self.predict = self._predict_named if self.use_named_args else self._predict_positional
             if self.algorithm == "grid" and self.backend != 'optuna':
                 fit_fn = self.grid_search
             elif self.algorithm == 'random' and self.backend not in ['optuna', 'hyperopt']:
@@ -663,7 +738,15 @@ Backend must be one of hyperopt, optuna or sklearn but is is {x}"""
         else:
             raise NotImplementedError(f"""No fit function found for algorithm {self.algorithm}
                                           with backend {self.backend}""")
-        res = fit_fn(*args, **kwargs)
+        try:
+            res = fit_fn(*args, **kwargs)
+        finally:
+            if self._results_fp is not None:
+                self._results_fp.close()
+                self._results_fp = None
+
+        if self._fingerprint is not None:
+            self._save_disk_cache()
 
         serialized = self.serialize()
         fname = os.path.join(self.opt_path, 'serialized.json')
@@ -694,47 +777,86 @@ Backend must be one of hyperopt, optuna or sklearn but is is {x}"""
             - We make objective_fn using AI4Water and return the error.
 
         In first case, we just return what user has provided.
+        The function is built only once unless objective_fn or param_space changes.
         """
+        cached = self.__dict__.get('_fitness_cached')
+        if cached is not None and cached[0] is self.objective_fn and cached[1] is self._param_space:
+            return cached[2]
+
+        fitness = self._build_fitness()
+        self._fitness_cached = (self.objective_fn, self._param_space, fitness)
+        return fitness
+
+    def _build_fitness(self):
         if callable(self.objective_fn) and not self.use_named_args:
             # external function for bayesian but this function does not require named args.
-            return self.objective_fn
+            def fitness(x):
+                # the optimizer may query the same point again
+                return self._error_of(tuple(_hashable(v) for v in x), x, partial(self.objective_fn, x))
+            return fitness
 
         dims = self.dims()
         if self.use_named_args:
             # external function and this function accepts named args.
             @use_named_args(dimensions=dims)
             def fitness(**kwargs):
-                return self.objective_fn(**kwargs)
+                return self._error_of(_trial_key(kwargs), kwargs, partial(self.objective_fn, **kwargs))
             return fitness
 
         raise ValueError(f"used named args is {self.use_named_args}")
 
     def own_fit(self):
 
-        if self.algorithm == "bayes":
-            minimize_func = gp_minimize
-        else: # bayes_rf
-            minimize_func = forest_minimize
-
         kwargs = self.gpmin_args
         if 'num_iterations' in kwargs:
             kwargs['n_calls'] = kwargs.pop('num_iterations')
 
+        if self.warm_start and kwargs.get('x0') is None:
+            x0, y0 = self._load_warm_start()
+            if x0:
+                kwargs = dict(kwargs, x0=x0, y0=y0)
+
+        surrogate = self.surrogate
+        if surrogate is None:
+            if self.algorithm == "bayes_rf":
+                surrogate = 'forest'
+            else:
+                surrogate = 'gp'
+
+        minimize_func = {'gp': gp_minimize, 'forest': forest_minimize, 'gbrt': gbrt_minimize}[surrogate]
+
+        if surrogate != 'gp':  # these are only accepted by gp_minimize
+            kwargs = {k: v for k, v in kwargs.items() if k not in ['n_restarts_optimizer', 'noise']}
+            if surrogate == 'forest':
+                kwargs.pop('acq_optimizer', None)
+
         try:
-            search_result = minimize_func(func=self.model_for_gpmin(),
-                                        dimensions=self.dims(),
-                                        **kwargs)
+            if kwargs.get('n_jobs', 1) != 1:
+                # several points are asked from the optimizer and evaluated in parallel
+                kwargs = dict(kwargs)
+                n_jobs = kwargs.pop('n_jobs')
+                search_result = _batched_minimize(
+                    self._eval_batch,
+                    dimensions=self.dims(),
+                    surrogate=surrogate,
+                    n_jobs=n_jobs,
+                    backend=self.parallel_backend,
+                    **kwargs)
+            else:
+                search_result = minimize_func(func=self.model_for_gpmin(),
+                                            dimensions=self.dims(),
+                                            **kwargs)
         except ValueError as e:
-            if int(''.join(sklearn.__version__.split('.')[1])) > 22:
+            if _SKLEARN_VERSION > (0, 22):
                 raise ValueError(f"""
                     For bayesian optimization, If your sklearn version is above 0.23,
                     then this error may be related to 
                     https://github.com/kiudee/bayes-skopt/issues/90 .
                     Try to lower the sklearn version to 0.22 and run again.
                     {e}
-                    """)
+                    """) from e
             else:
-                raise ValueError(e)
+                raise
 
         # the `space` in search_results may not be in same order as originally provided.
         space = search_result['space']
@@ -745,16 +867,19 @@ Backend must be one of hyperopt, optuna or sklearn but is is {x}"""
             search_result['space'] = Space(ordered_sapce.values())
 
         self.gpmin_results = search_result
+        self._save_warm_start(search_result)
 
         if len(self.results) < 1:
             fv = search_result.func_vals
             xiters = search_result.x_iters
-            self.results = {f'{round(k, 8)}_{idx}': self.to_kw(v) for idx, k, v in zip(range(self.num_iterations), fv, xiters)}
+            names = self._param_names()
+            self.results = {f'{round(k, 8)}_{idx}': dict(zip(names, v))
+                            for idx, k, v in zip(range(self.num_iterations), fv, xiters)}
 
         if self._process_results:
             post_process_skopt_results(search_result, self.results, self.opt_path)
 
-            if len(search_result.func_vals)<=100 and self.algorithm != "bayes_rf":
+            if len(search_result.func_vals)<=100 and surrogate == 'gp':
                 save_skopt_results(search_result, self.opt_path)
 
             self.process_results()
@@ -764,25 +889,173 @@ Backend must be one of hyperopt, optuna or sklearn but is is {x}"""
 
         return search_result
 
+    def _eval_batch(self, xs: list, parallel) -> list:
+        """returns the errors of the points asked together from skopt's Optimizer.
+        The points which have not been evaluated before are evaluated in parallel."""
+        names = [d.name for d in self.dims()]
+        if self.use_named_args:
+            paras = [dict(zip(names, x)) for x in xs]
+            keys = [_trial_key(para) for para in paras]
+        else:
+            paras = xs
+            keys = [tuple(_hashable(v) for v in x) for x in xs]
+
+        new = [(key, x, para) for key, x, para in zip(keys, xs, paras)
+               if not self.use_cache or key not in self._trial_cache]
+        if self.use_cache:  # the same point may have been asked twice
+            new = list({key: (key, x, para) for key, x, para in new}.values())
+
+        func = partial(_eval_point, self.objective_fn, names, self.use_named_args)
+        errors = parallel(delayed(func)(x) for _, x, _ in new)
+
+        for (key, _, para), err in zip(new, errors):
+            self._record_trial(key, err, para)
+
+        if not self.use_cache:
+            return errors
+
+        for key, para in zip(keys, paras):
+            self._run_trials[key] = self._trial_cache[key]
+            self._run_paras[key] = para
+        return [self._trial_cache[key] for key in keys]
+
+    def _error_of(self, key: tuple, para, call):
+        """returns the error of a set of parameters. The ``call`` which evaluates
+        the objective_fn is made only if the parameters have not been evaluated before."""
+        if not self.use_cache or key not in self._trial_cache:
+            self._record_trial(key, call(), para)
+        self._run_trials[key] = self._trial_cache[key]
+        self._run_paras[key] = para
+        return self._run_trials[key]
+
+    def _record_trial(self, key: tuple, err, para):
+        """stores the error of a newly evaluated set of parameters and, if the
+        errors are saved, appends it to eval_results.jsonl"""
+        self._trial_cache[key] = err
+        self._run_trials[key] = err
+        self._run_paras[key] = para
+        if self._results_fp is not None:
+            self._results_fp.write(json.dumps(
+                {"err": err, "key": key, "para": Jsonize(para)(), "fingerprint": self._fingerprint},
+                cls=JsonEncoder) + "\n")
+        return
+
+    def _load_disk_cache(self):
+        """loads the errors of parameters evaluated by previous runs in opt_path
+        with the same objective_fn, param_space and data"""
+        with shelve.open(os.path.join(self.opt_path, "eval_cache")) as db:
+            if db.get("fingerprint") == self._fingerprint:
+                self._trial_cache.update(db.get("trial_cache", {}))
+
+        # trials of a run which was interrupted before it could save the cache
+        fname = os.path.join(self.opt_path, "eval_results.jsonl")
+        if os.path.exists(fname):
+            with open(fname, "r") as fp:
+                for line in fp:
+                    try:
+                        row = json.loads(line)
+                    except json.JSONDecodeError:  # last line of a killed run may be incomplete
+                        continue
+                    # trials of a different objective_fn, param_space or data are ignored
+                    if "key" in row and row.get("fingerprint") == self._fingerprint:
+                        self._trial_cache[_hashable(row["key"])] = row["err"]
+        return
+
+    def _save_disk_cache(self):
+        with shelve.open(os.path.join(self.opt_path, "eval_cache")) as db:
+            if db.get("fingerprint") != self._fingerprint:  # errors of a different objective
+                db.clear()
+            db["fingerprint"] = self._fingerprint
+            db["trial_cache"] = self._trial_cache
+            db["results"] = self.results
+            if hasattr(self, 'trials'):  # so that hyperopt's Trials can be reused
+                try:
+                    db["trials"] = self.trials
+                except (pickle.PicklingError, AttributeError, TypeError):
+                    pass
+        return
+
+    def _warm_start_path(self) -> str:
+        return os.path.join(os.path.dirname(self.opt_path), "warm_start.pkl")
+
+    def _save_warm_start(self, search_result):
+        joblib.dump({"names": [d.name for d in self.dims()],
+                     "x": search_result.x_iters,
+                     "y": [float(y) for y in search_result.func_vals]},
+                    self._warm_start_path())
+        return
+
+    def _load_warm_start(self) -> tuple:
+        """returns the points evaluated by a previous run, which are inside the
+        current parameter space, as x0 and y0"""
+        x0, y0 = [], []
+        if not os.path.exists(self._warm_start_path()):
+            return x0, y0
+
+        prior = joblib.load(self._warm_start_path())
+        dims = self.dims()
+        if prior["names"] != [d.name for d in dims]:
+            return x0, y0
+
+        seen = set()
+        for x, y in zip(prior["x"], prior["y"]):
+            key = tuple(_hashable(v) for v in x)
+            if key not in seen and all(v in d for v, d in zip(x, dims)):
+                seen.add(key)
+                x0.append(x)
+                y0.append(y)
+
+        if self.verbosity > 0:
+            print(f"warm starting with {len(x0)} previously evaluated points")
+        return x0, y0
+
     def eval_sequence(self, params):
+        """evaluates the objective_fn for an iterable of parameter sets. The
+        parameter sets are consumed lazily so that the whole grid is not kept in memory."""
 
         if self.verbosity > 0:
             print(f"total number of iterations: {len(params)}")
-        for idx, para in enumerate(params):
 
-            if self.use_named_args:  # objective_fn is external but uses kwargs
-                err = self.objective_fn(**para)
-            else:  # objective_fn is external and does not uses keywork arguments
-                try:
-                    err = self.objective_fn(*list(para.values()))
-                except TypeError:
-                    raise TypeError(f"""
-                        use_named_args argument is set to {self.use_named_args}. If your
-                        objective function takes key word arguments, make sure that
-                        this argument is set to True during initiatiation of HyperOpt.""")
-            err = round(err, 8)
+        # identical parameters are evaluated only once
+        cached = []  # trials whose parameters have been evaluated or scheduled already
+
+        def new_trials():
+            scheduled = set()
+            for idx, para in enumerate(params):
+                key = _trial_key(para)
+                if self.use_cache and (key in self._trial_cache or key in scheduled):
+                    cached.append((idx, key, para))
+                else:
+                    scheduled.add(key)
+                    yield idx, key, para
+
+        # how objective_fn is called does not change during the search
+        call = _objective_caller(self.objective_fn, self.use_named_args, len(self.param_space))
+
+        n_jobs = self.gpmin_args.get('n_jobs', 1)
+        if n_jobs == 1:
+            evaluated = ((idx, key, para, round(call(para), 8)) for idx, key, para in new_trials())
+        else:
+            # the trials are independent of each other
+            evaluated = Parallel(n_jobs=n_jobs, backend=self.parallel_backend, return_as="generator")(
+                delayed(_eval_trial)(call, *trial) for trial in new_trials())
+
+        # results are merged in the main process in the order of trials
+        results = {}
+        order = self.original_para_order()
+
+        for idx, key, para, err in evaluated:
+            self._record_trial(key, err, para)
+            results[idx] = (err + idx, sort_x_iters(para, order))
+
+        for idx, key, para in cached:
+            self._run_trials[key] = self._trial_cache[key]
+            self._run_paras[key] = para
+            results[idx] = (self._trial_cache[key] + idx, sort_x_iters(para, order))
 
-            self.results[err + idx] = sort_x_iters(para, self.original_para_order())
+        for idx in sorted(results):
+            k, v = results[idx]
+            self.results[k] = v
 
         if self._process_results:
             self.process_results()
@@ -794,10 +1067,7 @@ Backend must be one of hyperopt, optuna or sklearn but is is {x}"""
 
     def grid_search(self):
 
-        params = list(ParameterGrid(self.param_space))
-        self.param_grid = params
-
-        return self.eval_sequence(params)
+        return self.eval_sequence(ParameterGrid(self.param_space))
 
     def random_search(self):
 
@@ -808,17 +1078,15 @@ Backend must be one of hyperopt, optuna or sklearn but is is {x}"""
                 {grid}. Please either provide the `num_samples` parameter while creating space or explicitly
                 provide grid for {k}"""
 
-        param_list = list(ParameterSampler(self.param_space, n_iter=self.num_iterations,
-                                           random_state=self.random_state))
+        sampler = ParameterSampler(self.param_space, n_iter=self.num_iterations,
+                                   random_state=self.random_state)
 
-        if len(param_list) < self.num_iterations:
+        if len(sampler) < self.num_iterations:
             # we need to correct it so that num_iterations gets calculated correctly next time
-            self.gpmin_args['n_calls'] = len(param_list)
-            self.gpmin_args['n_iter'] = len(param_list)
-
-        self.param_grid = param_list
+            self.gpmin_args['n_calls'] = len(sampler)
+            self.gpmin_args['n_iter'] = len(sampler)
 
-        return self.eval_sequence(param_list)
+        return self.eval_sequence(sampler)
 
     def optuna_objective(self, **kwargs):
 
@@ -836,14 +1104,15 @@ Backend must be one of hyperopt, optuna or sklearn but is is {x}"""
             suggestion = {}
             for space_name, _space in self.param_space.items():
                 suggestion[space_name] = _space.suggest(trial)
-            return self.objective_fn(**suggestion)
+            return self._predict_named(**suggestion)
 
         if self.algorithm in ['tpe', 'cmaes', 'random']:
             study = optuna.create_study(direction='minimize', sampler=sampler[self.algorithm]())
         else:
             space = {s.name: s.grid for s in self.skopt_space()}
             study = optuna.create_study(sampler=sampler[self.algorithm](space))
-        study.optimize(objective, n_trials=self.num_iterations)
+        # optuna evaluates the trials in n_jobs threads, each asking the sampler for a new trial
+        study.optimize(objective, n_trials=self.num_iterations, n_jobs=self.gpmin_args.get('n_jobs', 1))
         setattr(self, 'study', study)
 
         if self._process_results:
@@ -869,15 +1138,16 @@ Backend must be one of hyperopt, optuna or sklearn but is is {x}"""
         if self.use_named_args:
             def objective_fn(kws):
                 # the objective function in hyperopt library receives a dictionary
-                return self.objective_fn(**kws)
+                return self._predict_named(**kws)
             objective_f = objective_fn
         else:
-            objective_f = self.objective_fn
+            objective_f = self._predict_positional
 
-            if len(self.space()) > 1:
-                space = list(self.hp_space().values())
-            elif len(self.space()) == 1:
-                space = list(self.hp_space().values())[0]
+            hp_space = self.hp_space()
+            if len(hp_space) > 1:
+                space = list(hp_space.values())
+            elif len(hp_space) == 1:
+                space = next(iter(hp_space.values()))
             else:
                 raise NotImplementedError
 
@@ -888,8 +1158,7 @@ Backend must be one of hyperopt, optuna or sklearn but is is {x}"""
                              **kwargs,
                              **model_kws)
 
-        with open(os.path.join(self.opt_path, 'trials.json'), "w") as fp:
-            json.dump(Jsonize(trials.trials)(), fp, sort_keys=True, indent=4, cls=JsonEncoder)
+        _dump_trials(trials.trials, os.path.join(self.opt_path, 'trials.json'))
 
         setattr(self, 'trials', trials)
         # self.results = trials.results
@@ -899,12 +1168,19 @@ Backend must be one of hyperopt, optuna or sklearn but is is {x}"""
         return best
 
     def _predict(self, *args, **params):
-
         if self.use_named_args:
-            return self.objective_fn(**params)
+            return self._predict_named(**params)
 
         if callable(self.objective_fn) and not self.use_named_args:
-            return self.objective_fn(*args)
+            return self._predict_positional(*args)
+
+    # the callers decide once which of the following two is to be used
+    def _predict_named(self, **params):
+        # the parameters suggested again by the optimizer are not evaluated again
+        return self._error_of(_trial_key(params), params, partial(self.objective_fn, **params))
+
+    def _predict_positional(self, *args):
+        return self._error_of(tuple(_hashable(v) for v in args), list(args), partial(self.objective_fn, *args))
 
     def hp_space(self) -> dict:
         """returns a dictionary whose values are hyperopt equivalent space instances."""
@@ -922,31 +1198,46 @@ Backend must be one of hyperopt, optuna or sklearn but is is {x}"""
             # adding idx because sometimes the difference between two func_vals is negligible
             fv = self.gpmin_results['func_vals']
             xiters = self.gpmin_results['x_iters']
-            return {f'{round(k, 5)}_{idx}': self.to_kw(v) for idx, k,v in zip(range(len(fv)), fv, xiters)}
+            names = self._param_names()
+            return {f'{round(k, 5)}_{idx}': dict(zip(names, v)) for idx, k, v in zip(range(len(fv)), fv, xiters)}
         else:
             # for sklearn based
             return self.results
 
     def func_vals(self):
         if self.backend == 'hyperopt':
-            return [self.trials.results[i]['loss'] for i in range(self.num_iterations)]
+            return np.fromiter((r['loss'] for r in self.trials.results), dtype=np.float64,
+                               count=self.num_iterations)
         elif self.backend == 'optuna':
             return [s.values for s in self.study.trials]
         else:
-            return np.array(list(self.results.keys()), dtype=np.float32)
+            return np.fromiter(map(float, self.results.keys()), dtype=np.float32, count=len(self.results))
 
     def skopt_results(self):
         if self.use_own and self.algorithm in ["bayes", "bayes_rf"] and self.backend == 'skopt':
             return self.gpmin_results
         else:
+            best_paras = self.best_paras()
+            xy = self.xy_of_iterations()
+            # parameters can be categorical so x_iters is not an array
+            if self.backend in ['hyperopt', 'optuna']:
+                iters = [list(s.values()) for s in xy.values()]
+                vals = self.func_vals()
+            else:  # keys of results are the errors so both are filled in one pass
+                iters = []
+                vals = np.empty(len(xy), dtype=np.float32)
+                for idx, (k, v) in enumerate(xy.items()):
+                    vals[idx] = float(k)
+                    iters.append(list(v.values()))
+
             class SR:
-                x_iters = [list(s.values()) for s in self.xy_of_iterations().values()]
-                func_vals = self.func_vals()
+                x_iters = iters
+                func_vals = vals
                 space = self.skopt_space()
-                if isinstance(self.best_paras(), list):
-                    x = self.best_paras
-                elif isinstance(self.best_paras(), dict):
-                    x = list(self.best_paras().values())
+                if isinstance(best_paras, list):
+                    x = best_paras
+                elif isinstance(best_paras, dict):
+                    x = list(best_paras.values())
                 else:
                     raise NotImplementedError
 
@@ -959,13 +1250,14 @@ Backend must be one of hyperopt, optuna or sklearn but is is {x}"""
         optimized parameters.
         """
         d = self.xy_of_iterations()
-        k = list(dict(sorted(d.items())).keys())[0]
+        k = min(d, key=_key_error)
         paras = {k: d[k]}
 
         return paras
 
     def _plot_edf(self, save=True):
         # empirical CDF of objective function
+        import matplotlib.pyplot as plt
         plt.close("all")
         y = np.array(list(self.xy_of_iterations().keys())).astype("float64")
         plot_edf(y)
@@ -975,11 +1267,14 @@ Backend must be one of hyperopt, optuna or sklearn but is is {x}"""
 
     def _plot_parallel_coords(self, save=True, **kwargs):
         # parallel coordinates of hyperparameters
+        import matplotlib.pyplot as plt
+        from easy_mpl import parallel_coordinates
+
         d = self.xy_of_iterations()
 
         data = pd.DataFrame([list(v.values()) for v in d.values()],
                             columns=[s for s in self.space()])
-        categories = np.array(list(self.xy_of_iterations().keys())).astype("float64")
+        categories = np.array(list(d.keys())).astype("float64")
         parallel_coordinates(
             data=data,
             categories=categories,
@@ -992,6 +1287,9 @@ Backend must be one of hyperopt, optuna or sklearn but is is {x}"""
         return
 
     def _plot_evaluations(self, save=True):
+        import matplotlib.pyplot as plt
+        from skopt.plots import plot_evaluations
+
         plt.close('all')
         plot_evaluations(self.skopt_results(), dimensions=self.best_paras(as_list=True))
         if save:
@@ -1000,15 +1298,24 @@ Backend must be one of hyperopt, optuna or sklearn but is is {x}"""
                         bbox_inches='tight')
         return
 
-    def _plot_convergence(self, save=True):
-        plt.close('all')
+    def _plot_convergence(self, save=True, sr=None):
         # todo, should include an option to plot original evaluations instead of only minimum
-        plot_convergence([self.skopt_results()])
+        mins = self._convergence_data(sr)
         if save:
+            # the png is written in background so that fit can return meanwhile
             fname = os.path.join(self.opt_path, "convergence.png")
-            plt.savefig(fname, dpi=300, bbox_inches='tight')
+            threading.Thread(target=_write_convergence_png, args=(mins, fname)).start()
+        else:
+            import matplotlib.pyplot as plt
+            plt.close('all')
+            _convergence_plot(mins, plt.gca())
         return
 
+    def _convergence_data(self, sr=None) -> np.ndarray:
+        """minimum of objective function after each iteration"""
+        sr = self.skopt_results() if sr is None else sr
+        return np.minimum.accumulate(np.asarray(sr.func_vals, dtype=np.float64).reshape(-1))
+
     def process_results(self):
         """post processing of results"""
         self.save_iterations_as_xy()
@@ -1029,7 +1336,7 @@ Backend must be one of hyperopt, optuna or sklearn but is is {x}"""
 
         # convergence plot
         if sr.x_iters is not None and self.backend != "skopt":
-            self._plot_convergence()
+            self._plot_convergence(sr=sr)
 
         # plot of hyperparameter space as explored by the optimizer
         if self.backend != 'skopt' and len(self.space()) < 20:  # and len(self.space())>1:
@@ -1066,6 +1373,7 @@ Backend must be one of hyperopt, optuna or sklearn but is is {x}"""
                 warnings.warn(msg)
 
         else:
+            import matplotlib.pyplot as plt
             importances, importance_paras, ax = plot_param_importances(self.optuna_study())
             if importances is not None and save:
                 plt.savefig(os.path.join(self.opt_path, 'fanova_importance_bar.png'),
@@ -1091,6 +1399,8 @@ Backend must be one of hyperopt, optuna or sklearn but is is {x}"""
 
     def _plot_distributions(self, save=True):
         """plot distributions of explored hyperparameters"""
+        import matplotlib.pyplot as plt
+        from easy_mpl import hist
         try:
             from pandas.plotting._matplotlib.tools import create_subplots
         except ImportError: # for older pandas versions
@@ -1098,7 +1408,7 @@ Backend must be one of hyperopt, optuna or sklearn but is is {x}"""
 
 
         # name of hyperparameters
-        h_paras = list(list(self.best_xy().values())[0].keys())
+        h_paras = list(next(iter(self.best_xy().values())))
 
         # container with a list for each hyperparameter
         h_para_lists = {k: [] for k in h_paras}
@@ -1125,44 +1435,73 @@ Backend must be one of hyperopt, optuna or sklearn but is is {x}"""
         return
 
     def to_kw(self, x):
-        names = []
-        if isinstance(self.space(), dict):
-            for key in self.space().keys():
-                names.append(key)
-        else:
-            raise NotImplementedError
-
-        xkv = {}
-        if names is not None:
-            for name, val in zip(names, x):
-                xkv[name] = val
-        else:
-            xkv = x
+        return dict(zip(self._param_names(), x))
 
-        return xkv
+    def _param_names(self) -> tuple:
+        # names of parameters do not change after the space is defined
+        if self._names is None:
+            space = self.space()
+            if not isinstance(space, dict):
+                raise NotImplementedError
+            self._names = tuple(space.keys())
+        return self._names
 
-    def eval_with_best(self):
+    def eval_with_best(self, top_k: int = 1, n_repeats: int = 1, n_jobs: int = 1):
         """
         Find the best parameters and evaluate the objective_fn with them.
+
         Arguments:
-            return_model bool: If True, then then the built objective_fn will be returned
+            top_k int: number of best parameter sets to evaluate
+            n_repeats int: number of times each parameter set is evaluated e.g.
+                to average the error over different random seeds. These evaluations
+                do not use the stored errors.
+            n_jobs int: number of parallel jobs for the evaluations
+
+        Returns:
+            output of objective_fn with the best parameters if top_k and n_repeats
+            are 1, otherwise a list of outputs, n_repeats for each parameter set
+            starting with the best.
         """
+        candidates = self._top_paras(top_k)
 
-        if self.use_named_args:
-            x = self.best_paras()
+        calls = []
+        for x in candidates:
+            if self.use_named_args:
+                args, kwargs = (), x
+            else:
+                x = list(x.values())
+                if self.backend == 'hyperopt' and len(x) == 1:  # when x = [x]
+                    x = x[0]
+                args, kwargs = (x,), {}
+            calls += [(args, kwargs)] * n_repeats
+
+        if n_jobs == 1:
+            outputs = [self.objective_fn(*args, **kwargs) for args, kwargs in calls]
         else:
-            x = self.best_paras(True)
+            outputs = Parallel(n_jobs=n_jobs, backend=self.parallel_backend)(
+                delayed(self.objective_fn)(*args, **kwargs) for args, kwargs in calls)
 
-        if self.use_named_args:
-            return self.objective_fn(**x)
+        if top_k == 1 and n_repeats == 1:
+            return outputs[0]
+        return outputs
 
-        if callable(self.objective_fn) and not self.use_named_args:
-            if isinstance(x, list) and self.backend == 'hyperopt':  # when x = [x]
-                if len(x) == 1:
-                    x = x[0]
-            return self.objective_fn(x)
+    def _top_paras(self, k: int) -> list:
+        """returns the k best sets of parameters as dictionaries"""
+        if k == 1:
+            return [self.best_paras()]
 
-        raise NotImplementedError
+        if self.use_sklearn or self.use_skopt_bayes:
+            cv = self.optfn.cv_results_
+            return [cv['params'][i] for i in np.argsort(cv['rank_test_score'], kind='stable')[:k]]
+
+        if not self.use_skopt_gpmin and self.backend not in ['hyperopt', 'optuna'] and self._run_trials:
+            # the keys of self.results are shifted by the index of the iteration
+            # and self._trial_cache may contain parameters of previous runs
+            best = sorted(self._run_trials, key=self._run_trials.get)[:k]
+            return [sort_x_iters(dict(self._run_paras[b]), list(self.param_space.keys())) for b in best]
+
+        d = self.xy_of_iterations()
+        return [d[key] for key in sorted(d, key=_key_error)[:k]]
 
     @classmethod
     def from_gp_parameters(cls, fpath: str, objective_fn):
@@ -1351,3 +1690,284 @@ Backend must be one of hyperopt, optuna or sklearn but is is {x}"""
             y0.append(float(y))
             x0.append(list(x.values()))
         return x0, y0
+
+
+class _TrialsEncoder(JsonEncoder):
+    # converts the objects inside trials while they are being written, instead of
+    # first making a converted copy of all the trials
+    def default(self, obj):
+        try:
+            return super().default(obj)
+        except TypeError:
+            return Jsonize(obj)()
+
+
+def _dump_trials(trials: list, fname: str):
+    """writes the trials of hyperopt in a json file. If orjson is installed, it
+    is used because it is much faster for large number of trials. The file is
+    same in both cases except that orjson writes NaN and infinity as null."""
+    if orjson is None:
+        with open(fname, "w") as fp:
+            json.dump(trials, fp, sort_keys=True, indent=4, cls=_TrialsEncoder)
+    else:
+        # numpy types and datetimes are passed to default so that they are written as with json
+        encoded = orjson.dumps(trials, default=_TrialsEncoder().default,
+                               option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_PASSTHROUGH_DATETIME)
+        # indentation of 4 spaces, as written by json
+        encoded = _INDENT.sub(lambda m: m.group(0) * 2, encoded)
+        if not encoded.isascii():  # json escapes non-ascii characters
+            encoded = _NON_ASCII.sub(lambda m: json.dumps(m.group(0))[1:-1], encoded.decode()).encode()
+        with open(fname, "wb") as fp:
+            fp.write(encoded)
+    return
+
+
+# leading spaces of each line of json, strings in json can not contain newlines
+_INDENT = re.compile(rb"^ +", re.MULTILINE)
+_NON_ASCII = re.compile(r"[^\x00-\x7f]")
+
+
+def _convergence_plot(mins: np.ndarray, ax):
+    # same as skopt's plot_convergence but the running minimum is calculated only once
+    from matplotlib import cm
+
+    ax.set_title("Convergence plot")
+    ax.set_xlabel("Number of calls $n$")
+    ax.set_ylabel(r"$\min f(x)$ after $n$ calls")
+    ax.grid()
+    ax.plot(range(1, len(mins) + 1), mins, c=cm.viridis(0.25), marker=".", markersize=12, lw=2)
+    return ax
+
+
+def _write_convergence_png(mins: np.ndarray, fname: str):
+    # the figure is not managed by pyplot so that it can be saved from a thread
+    from matplotlib.figure import Figure
+
+    fig = Figure()
+    _convergence_plot(mins, fig.add_subplot())
+    fig.savefig(fname, dpi=300, bbox_inches='tight')
+    return
+
+
+def _call_with_kwargs(objective_fn, para: dict):
+    return objective_fn(**para)
+
+
+def _call_with_args(objective_fn, para: dict):
+    return objective_fn(*para.values())
+
+
+def _objective_caller(objective_fn, use_named_args: bool, num_paras: int):
+    """returns a function which calls the objective_fn with one set of parameters
+    of grid/random search"""
+    if use_named_args:  # objective_fn is external but uses kwargs
+        return partial(_call_with_kwargs, objective_fn)
+
+    # objective_fn is external and does not uses keywork arguments
+    try:
+        signature = inspect.signature(objective_fn)
+    except (TypeError, ValueError):  # signature of some builtins can not be inspected
+        signature = None
+
+    if signature is not None:
+        try:
+            signature.bind(*range(num_paras))
+        except TypeError:
+            raise TypeError(f"""
+                use_named_args argument is set to {use_named_args}. If your
+                objective function takes key word arguments, make sure that
+                this argument is set to True during initiatiation of HyperOpt.""")
+    return partial(_call_with_args, objective_fn)
+
+
+def _eval_trial(call, idx: int, key: tuple, para: dict) -> tuple:
+    return idx, key, para, round(call(para), 8)
+
+
+def _eval_point(objective_fn, names: list, use_named_args: bool, x: list) -> float:
+    """evaluates the objective_fn at one point suggested by skopt's Optimizer"""
+    if use_named_args:
+        return objective_fn(**dict(zip(names, x)))
+    return objective_fn(x)
+
+
+def _batched_minimize(
+        evaluate,
+        dimensions,
+        surrogate: str = 'gp',
+        n_jobs: int = -1,
+        backend: str = 'loky',
+        base_estimator=None,
+        n_calls: int = 100,
+        n_random_starts: int = None,
+        n_initial_points: int = 10,
+        initial_point_generator: str = "random",
+        acq_func: str = None,
+        acq_optimizer: str = None,
+        x0=None,
+        y0=None,
+        random_state=None,
+        verbose: bool = False,
+        callback=None,
+        n_points: int = 10000,
+        n_restarts_optimizer: int = 5,
+        xi: float = 0.01,
+        kappa: float = 1.96,
+        noise="gaussian",
+        model_queue_size=None,
+):
+    """
+    Accepts the same arguments as skopt's gp_minimize/forest_minimize/gbrt_minimize
+    but n_jobs points are asked at once from skopt's Optimizer and are evaluated
+    in parallel. The pending points are given the minimum observed value (constant
+    liar strategy) while asking for the next point. Therefore the points, which
+    are evaluated, and thus the result depend upon n_jobs. ``evaluate`` is called
+    with a list of points and joblib's Parallel and returns a list of errors.
+    """
+    # stored in the result, as done by skopt, for post-processing of results
+    specs = {"args": dict(locals(), func=evaluate), "function": "_batched_minimize"}
+    n_jobs = effective_n_jobs(n_jobs)
+
+    if base_estimator is None:
+        if surrogate == 'gp' and noise != "gaussian":
+            base_estimator = cook_estimator("GP", space=Space(dimensions), noise=noise)
+        else:
+            base_estimator = {'gp': "GP", 'forest': "ET", 'gbrt': "GBRT"}[surrogate]
+
+    if acq_func is None:
+        acq_func = "gp_hedge" if surrogate == 'gp' else "EI"
+    if acq_optimizer is None:
+        acq_optimizer = "lbfgs" if surrogate == 'gp' else "sampling"
+    if n_random_starts is not None:
+        n_initial_points = n_random_starts
+
+    x0 = [] if x0 is None else x0
+    if x0 and not isinstance(x0[0], (list, tuple)):
+        x0 = [x0]
+    if y0 is not None and not isinstance(y0, (list, tuple)):
+        y0 = [y0]
+
+    optimizer = Optimizer(dimensions, base_estimator,
+                          n_initial_points=n_initial_points + len(x0),
+                          initial_point_generator=initial_point_generator,
+                          acq_func=acq_func,
+                          acq_optimizer=acq_optimizer,
+                          random_state=random_state,
+                          model_queue_size=model_queue_size,
+                          acq_optimizer_kwargs={"n_points": n_points,
+                                                "n_restarts_optimizer": n_restarts_optimizer},
+                          acq_func_kwargs={"xi": xi, "kappa": kappa})
+    specs['args']['base_estimator'] = optimizer.base_estimator_
+
+    if callback is None:
+        callbacks = []
+    else:
+        callbacks = list(callback) if isinstance(callback, (list, tuple)) else [callback]
+
+    with Parallel(n_jobs=n_jobs, backend=backend, verbose=int(verbose)) as parallel:
+
+        result = None
+        if x0:
+            if y0 is None:
+                y0 = evaluate(x0, parallel)
+                n_calls -= len(y0)
+            result = optimizer.tell(x0, y0)
+            result.specs = specs
+
+        while n_calls > 0:
+            xs = optimizer.ask(n_points=min(n_jobs, n_calls), strategy="cl_min")
+            result = optimizer.tell(xs, evaluate(xs, parallel))
+            result.specs = specs
+            n_calls -= len(xs)
+            if any([c(result) for c in callbacks]):
+                break
+
+    return result
+
+
+def _code_state(code) -> tuple:
+    # code objects can not be pickled, nested functions are among the constants
+    return code.co_code, code.co_names, tuple(_code_state(c) if inspect.iscode(c) else c for c in code.co_consts)
+
+
+def _state_of(obj, _depth: int = 0):
+    """represents a function by its code and the values it refers to, because
+    functions are pickled only by their names."""
+    if isinstance(obj, partial):
+        return _state_of(obj.func, _depth), obj.args, obj.keywords
+    if inspect.ismethod(obj):
+        return _state_of(obj.__func__, _depth), obj.__self__
+    if not inspect.isfunction(obj):
+        return obj
+
+    code = obj.__code__
+    if _depth > 0:  # the functions called by objective_fn are represented by their code only
+        return _code_state(code)
+
+    refs = {}
+    for name in code.co_names:  # global variables e.g. data used by the function
+        value = obj.__globals__.get(name)
+        if value is not None and not inspect.ismodule(value):
+            refs[name] = _state_of(value, _depth + 1)
+
+    cells = []
+    for cell in obj.__closure__ or ():
+        try:
+            cells.append(_state_of(cell.cell_contents, _depth + 1))
+        except ValueError:  # empty cell
+            cells.append(None)
+
+    return _code_state(code), obj.__defaults__, obj.__kwdefaults__, tuple(cells), refs
+
+
+def _space_state(space):
+    # skopt's dimensions hold a random state which differs from run to run
+    if isinstance(space, dict):
+        return {k: _space_state(v) for k, v in space.items()}
+    if isinstance(space, (list, tuple)):
+        return [_space_state(v) for v in space]
+    if Dimension is not None and isinstance(space, Dimension):
+        return type(space).__name__, repr(space)
+    return space
+
+
+def _fingerprint(objective_fn, param_space, data):
+    """hash of the objects on which the errors of trials depend. Returns None if
+    they can not be hashed."""
+    try:
+        return joblib.hash((_state_of(objective_fn), _space_state(param_space), data))
+    except (pickle.PicklingError, TypeError, AttributeError, ValueError):
+        return None
+
+
+def _key_error(key) -> float:
+    """value of objective function from the keys of iterations which are either
+    floats or strings of the form '{error}_{index}'"""
+    if isinstance(key, str):
+        return float(key.split('_')[0])
+    return float(key)
+
+
+_NATIVE_TYPES = frozenset([int, str, bool, type(None)])
+# floats are rounded to these many significant digits so that the points which
+# differ only by floating point noise e.g. 0.3 and 0.3000000001 are same trial
+_KEY_DIGITS = 9
+
+
+def _hashable(v):
+    if type(v) in _NATIVE_TYPES:  # most common case, checked first
+        return v
+    elif isinstance(v, (float, np.floating)):
+        return float(f"{v:.{_KEY_DIGITS}g}")
+    elif isinstance(v, np.generic):
+        return v.item()
+    elif isinstance(v, (list, tuple, np.ndarray)):
+        return tuple(_hashable(i) for i in v)
+    elif isinstance(v, dict):
+        return _trial_key(v)
+    return v
+
+
+def _trial_key(para: dict) -> tuple:
+    """canonical representation of a set of parameters to be used as dictionary key"""
+    return tuple(sorted((k, _hashable(v)) for k, v in para.items()))
@@ -1,4 +1,5 @@
 import warnings
+import itertools
 from typing import Union
 
 import numpy as np
@@ -28,6 +29,9 @@ except ImportError:
 
 from ai4water.utils.utils import Jsonize
 
+# used to give unique names to the unnamed dimensions
+_name_counter = itertools.count(1)
+
 # helper class to be able to print [1, ..., 4] instead of [1, '...', 4]
 class _Ellipsis:
     def __repr__(self):
@@ -71,7 +75,6 @@ class Real(_Real):
         >>> from ai4water.hyperopt import Real
         >>> lr = Real(low=0.0005, high=0.01, prior='log', name='lr')
     """
-    counter = 0
     def __init__(self,
                  low: float = None,
                  high: float = None,
@@ -96,9 +99,8 @@ class Real(_Real):
             low = np.min(grid)
             high = np.max(grid)
 
-        self.counter += 1
         if 'name' not in kwargs:
-            kwargs['name'] = f'real_{self.counter}'
+            kwargs['name'] = f'real_{next(_name_counter)}'
 
         if skopt is not None:
             kwargs = check_prior(kwargs)
@@ -110,19 +112,17 @@ class Real(_Real):
 
     @property
     def grid(self):
-        return self._grid
-
-    @grid.setter
-    def grid(self, x):
-        if x is None:
+        # created on first access because bayesian optimization does not need it
+        if self._grid is None:
             if self.num_samples:
                 self._grid = np.linspace(self.low, self.high, self.num_samples)
             elif self.step:
                 self._grid = np.arange(self.low, self.high, self.step)
-            else:
-                self._grid = None
-        else:
-            self._grid = np.array(x)
+        return self._grid
+
+    @grid.setter
+    def grid(self, x):
+        self._grid = None if x is None else np.asarray(x, dtype=np.float64)
 
     def as_hp(self, as_named_args=True):
 
@@ -158,6 +158,7 @@ class Real(_Real):
 
     def serialize(self):
         """Serializes the `Real` object so that it can be saved in json"""
+        self.grid  # so that the grid is also serialized
         _raum = {k: Jsonize(v)() for k, v in self.__dict__.items() if not callable(v)}
         _raum.update({'type': 'Real'})
         return _raum
@@ -191,7 +192,6 @@ class Integer(_Integer):
         >>> units = Integer(low=16, high=128, name='units')
 
     """
-    counter = 0
     def __init__(self,
                  low: int = None,
                  high: int = None,
@@ -219,9 +219,8 @@ class Integer(_Integer):
             low = np.min(grid)
             high = np.max(grid)
 
-        self.counter += 1
         if 'name' not in kwargs:
-            kwargs['name'] = f'integer_{self.counter}'
+            kwargs['name'] = f'integer_{next(_name_counter)}'
 
         self.num_samples = num_samples
         self.step = step
@@ -234,22 +233,21 @@ class Integer(_Integer):
 
     @property
     def grid(self):
+        # created on first access because bayesian optimization does not need it
+        if self._grid is None:
+            if self.num_samples:
+                self._grid = np.linspace(self.low, self.high, self.num_samples, dtype=np.int32).tolist()
+            elif self.step:
+                self._grid = np.arange(self.low, self.high, self.step, dtype=np.int32).tolist()
         return self._grid
 
     @grid.setter
     def grid(self, x):
         if x is None:
-            if self.num_samples:
-                __grid = np.linspace(self.low, self.high, self.num_samples, dtype=np.int32)
-                self._grid = [int(val) for val in __grid]
-            elif self.step:
-                __grid = np.arange(self.low, self.high, self.step, dtype=np.int32)
-                self._grid = [int(val) for val in __grid]
-            else:
-                self._grid = None
+            self._grid = None
         else:
             assert hasattr(x, '__len__'), f"unacceptable type of grid {x.__class__.__name__}"
-            self._grid = np.array(x)
+            self._grid = np.asarray(x)
 
     def as_hp(self, as_named_args=True):
         if as_named_args:
@@ -279,6 +277,7 @@ class Integer(_Integer):
 
     def serialize(self):
         """Serializes the `Integer` object so that it can be saved in json"""
+        self.grid  # so that the grid is also serialized
         _raum = {k: Jsonize(v)() for k, v in self.__dict__.items() if not callable(v)}
         _raum.update({'type': 'Integer'})
         return _raum
@@ -49,12 +49,15 @@ def x_iter_for_tpe(trials, param_space: dict, as_list=True):
 
     x_iters = []  # todo, remove x_iters, it is just values of iterations
     iterations = {}
+    # space_eval is expensive so each option of a choice parameter is evaluated only once
+    choices = {para for para, space in param_space.items() if is_choice(space)}
+    options = {}
     for idx, t in enumerate(trials.trials):
 
         vals = t['misc']['vals']
         y = t['result']['loss']
 
-        _iter = get_one_tpe_x_iter(vals, param_space)
+        _iter = _tpe_x_iter(vals, param_space, choices, options)
         iterations[f'{round(y, 5)}_{idx}'] = _iter
 
         x_iters.append(_iter)
@@ -66,12 +69,20 @@ def x_iter_for_tpe(trials, param_space: dict, as_list=True):
 
 def get_one_tpe_x_iter(tpe_vals, param_space: dict, sort=True):
 
+    choices = {para for para, space in param_space.items() if is_choice(space)}
+    return _tpe_x_iter(tpe_vals, param_space, choices, {}, sort=sort)
+
+
+def _tpe_x_iter(tpe_vals, param_space: dict, choices: set, options: dict, sort=True):
+    # options maps (parameter, index) of choice parameters to the chosen value
+
     x_iter = {}
     for para, para_val in tpe_vals.items():
-        if is_choice(param_space[para]):
-            hp_assign = {para: para_val[0]}
-            cval = space_eval(param_space[para], hp_assign)
-            x_iter[para] = cval
+        if para in choices:
+            key = (para, para_val[0])
+            if key not in options:
+                options[key] = space_eval(param_space[para], {para: para_val[0]})
+            x_iter[para] = options[key]
         else:
             x_iter[para] = para_val[0]
 
@@ -303,7 +314,7 @@ def post_process_skopt_results(skopt_results, results, opt_path):
 
     skopt_plots(skopt_results, pref=opt_path)
 
-    if 'folder' in list(results.items())[0]:
+    if 'folder' in next(iter(results.items())):
         clear_weights(results=results, opt_dir=opt_path)
     else:
         clear_weights(results=results, opt_dir=opt_path)
@@ -700,9 +700,13 @@ class RegressionMetrics(Metrics):
         """
         # Calculate metric
         n = self.predicted.size
-        tot = 0.0
-        for i in range(n):
-            tot = tot + np.sum(np.abs(self.predicted - self.true[i]))
+        # sum of |predicted[j] - true[i]| over all pairs, using sorted trues
+        # instead of a python loop over true values
+        true = np.sort(self.true.reshape(-1, ))
+        cum_true = np.concatenate([[0.0], np.cumsum(true)])
+        pred = self.predicted.reshape(-1, )
+        k = np.searchsorted(true, pred)
+        tot = np.sum(pred * k - cum_true[k] + (cum_true[-1] - cum_true[k]) - pred * (n - k))
         mae_val = np.sum(np.abs(self.predicted - self.true)) / n
         mb = 1 - ((n ** 2) * mae_val / tot)
 
@@ -1187,23 +1191,20 @@ class RegressionMetrics(Metrics):
         https://hess.copernicus.org/articles/24/2505/2020/hess-24-2505-2020.pdf
         """
         # todo, is this spearman rank correlation?
-        col = [list(a) for a in zip(self.true, self.predicted)]
-        xy = sorted(col, key=lambda _x: _x[0], reverse=False)
-        # rang of x-value
-        for i, row in enumerate(xy):
-            row.append(i + 1)
-
-        a = sorted(xy, key=lambda _x: _x[1], reverse=False)
-        # rang of y-value
-        for i, row in enumerate(a):
-            row.append(i + 1)
-
-        mw_rank_x = np.nanmean(np.array(a)[:, 2])
-        mw_rank_y = np.nanmean(np.array(a)[:, 3])
-
-        numerator = np.nansum([float((a[j][2] - mw_rank_x) * (a[j][3] - mw_rank_y)) for j in range(len(a))])
-        denominator1 = np.sqrt(np.nansum([(a[j][2] - mw_rank_x) ** 2. for j in range(len(a))]))
-        denominator2 = np.sqrt(np.nansum([(a[j][3] - mw_rank_x) ** 2. for j in range(len(a))]))
+        true, predicted = self.true.reshape(-1, ), self.predicted.reshape(-1, )
+        # rank of x-value
+        rank_x = np.empty(len(true))
+        rank_x[np.argsort(true, kind="stable")] = np.arange(1, len(true) + 1)
+        # rank of y-value, ties are resolved by the rank of x-value
+        rank_y = np.empty(len(true))
+        rank_y[np.lexsort((rank_x, predicted))] = np.arange(1, len(true) + 1)
+
+        mw_rank_x = np.nanmean(rank_x)
+        mw_rank_y = np.nanmean(rank_y)
+
+        numerator = np.nansum((rank_x - mw_rank_x) * (rank_y - mw_rank_y))
+        denominator1 = np.sqrt(np.nansum((rank_x - mw_rank_x) ** 2.))
+        denominator2 = np.sqrt(np.nansum((rank_y - mw_rank_x) ** 2.))
         return float(numerator / (denominator1 * denominator2))
 
     def sse(self) -> float:
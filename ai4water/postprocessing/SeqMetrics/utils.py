@@ -1,23 +1,15 @@
 import os
 import itertools
 from types import FunctionType
-from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 
 import numpy as np
-import matplotlib.pyplot as plt
 from scipy.special import xlogy
 
 try:
-    import plotly.graph_objects as go
+    from tsdownsample import LTTBDownsampler
 except ModuleNotFoundError:
-    go = None
-
-
-def take(st, en, d):
-    keys = list(d.keys())[st:en]
-    values = list(d.values())[st:en]
-
-    return {k: v for k, v in zip(keys, values)}
+    LTTBDownsampler = None
 
 
 def plot_metrics(
@@ -29,6 +21,7 @@ def plot_metrics(
         show: bool = True,
         save: bool = False,
         save_path: str = None,
+        n_jobs: int = 1,
         **kwargs):
     """
     Plots the metrics given as dictionary as radial or bar plot between specified ranges.
@@ -49,6 +42,9 @@ def plot_metrics(
             if True, the figure will be saved.
         save_path:
             if given, the figure will the saved at this location.
+        n_jobs:
+            number of processes used to draw and save the figures. -1 means
+            all available cores. Only used when ``show`` is False.
         kwargs:
             keyword arguments for plotting
 
@@ -69,25 +65,25 @@ def plot_metrics(
         assert rng[1] > rng[0], f'For range {idx}, second value: {rng[1]} is not greater than first value: {rng[0]}. '
         assert len(rng) == 2, f"Range number {idx} has length {len(rng)}. It must be a tuple of length 2."
 
-    if exclude is None:
-        exclude = []
+    exclude = set() if exclude is None else set(exclude)
 
-    _metrics = metrics.copy()
-    for k in metrics.keys():
-        if k in exclude:
-            _metrics.pop(k)
+    _metrics = {k: v for k, v in metrics.items() if k not in exclude}
 
     assert plot_type in ['bar', 'radial'], f'plot_type must be either `bar` or `radial`.'
 
-    for _range in ranges:
-        plot_metrics_between(
-            _metrics,
-            *_range,
-            plot_type=plot_type,
-            max_metrics_per_fig=max_metrics_per_fig,
-            show=show,
-            save=save,
-            save_path=save_path, **kwargs)
+    tasks = [(d, plot_type, *_range) for _range in ranges
+             for d in _chunks(_metrics, *_range, max_metrics_per_fig)]
+
+    if n_jobs != 1 and not show and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=None if n_jobs == -1 else n_jobs,
+                                 initializer=_use_agg) as executor:
+            futures = [executor.submit(_plot_chunk, *task, save=save, show=show, save_path=save_path, **kwargs)
+                       for task in tasks]
+            for future in futures:
+                future.result()
+    else:
+        for task in tasks:
+            _plot_chunk(*task, save=save, show=show, save_path=save_path, **kwargs)
     return
 
 
@@ -101,31 +97,39 @@ def plot_metrics_between(
         show=True,
         save_path=None,
         **kwargs):
-    zero_to_one = {}
-    for k, v in errors.items():
-        if v is not None:
-            if lower < v < upper:
-                zero_to_one[k] = v
-    st = 0
-    n = len(zero_to_one)
-    for i in np.array(np.linspace(0, n, int(n/max_metrics_per_fig)+1),
-                      dtype=np.int32):
-        if i == 0:
-            pass
-        else:
-            en = i
-            d = take(st, en, zero_to_one)
-            if plot_type == 'radial':
-                plot_radial(d, lower, upper, save=save, show=show, save_path=save_path, **kwargs)
-            else:
-                plot_circular_bar(d, save=save, show=show, save_path=save_path, **kwargs)
-            st = i
+    for d in _chunks(errors, lower, upper, max_metrics_per_fig):
+        _plot_chunk(d, plot_type, lower, upper, save=save, show=show, save_path=save_path, **kwargs)
+    return
+
+
+def _use_agg():
+    import matplotlib
+    matplotlib.use('Agg')
+
+
+def _chunks(errors: dict, lower, upper, max_metrics_per_fig: int):
+    """yields dictionaries of at most max_metrics_per_fig errors whose values
+    lie between lower and upper."""
+    zero_to_one = [(k, v) for k, v in errors.items() if v is not None and lower < v < upper]
+
+    for st in range(0, len(zero_to_one), max_metrics_per_fig):
+        yield dict(zero_to_one[st:st + max_metrics_per_fig])
+
+
+def _plot_chunk(d: dict, plot_type: str, lower, upper, save=False, show=True, save_path=None, **kwargs):
+    if plot_type == 'radial':
+        plot_radial(d, lower, upper, save=save, show=show, save_path=save_path, **kwargs)
+    else:
+        plot_circular_bar(d, save=save, show=show, save_path=save_path, **kwargs)
     return
 
 
 def plot_radial(errors: dict, low: int, up: int, save=True, save_path=None, **kwargs):
-    """Plots all the errors in errors dictionary. low and up are used to draw the limits of radial plot."""
-    if go is None:
+    """Plots all the errors in errors dictionary. low and up are used to draw the limits of radial plot.
+    When there are more than 500 errors, the webgl based Scatterpolargl trace is used."""
+    try:
+        import plotly.graph_objects as go
+    except ModuleNotFoundError:
         print("can not plot radial plot because plotly is not installed.")
         return
 
@@ -134,16 +138,19 @@ def plot_radial(errors: dict, low: int, up: int, save=True, save_path=None, **kw
     line = kwargs.get('line', None)
     marker = kwargs.get('marker', None)
 
-    OrderedDict(sorted(errors.items(), key=lambda kv: kv[1]))
+    categories = list(errors.keys())
+    values = np.fromiter(errors.values(), dtype=np.float64, count=len(errors))
 
-    lower = round(np.min(list(errors.values())), 4)
-    upper = round(np.max(list(errors.values())), 4)
+    lower = round(values.min(), 4)
+    upper = round(values.max(), 4)
 
     fig = go.Figure()
-    categories = list(errors.keys())
 
-    fig.add_trace(go.Scatterpolar(
-        r=list(errors.values()),
+    # svg traces become slow with many points, so use webgl for them
+    trace = go.Scatterpolargl if len(categories) > 500 else go.Scatterpolar
+
+    fig.add_trace(trace(
+        r=values,
         theta=categories,  # angular coordinates
         fill=fill,
         fillcolor=fillcolor,
@@ -162,7 +169,8 @@ def plot_radial(errors: dict, low: int, up: int, save=True, save_path=None, **kw
         showlegend=False
     )
 
-    fig.show()
+    if kwargs.get('show', True):
+        fig.show()
     if save:
         fname = f"radial_errors_from_{lower}_to_{upper}.png"
         if save_path is not None:
@@ -171,6 +179,32 @@ def plot_radial(errors: dict, low: int, up: int, save=True, save_path=None, **kw
     return
 
 
+def _polar_layout(value: np.ndarray, lower_limit):
+    """computes heights, angles, width and label rotations of the bars of
+    a circular bar plot. flip tells which labels are flipped upside down."""
+    # Compute max and min in the dataset
+    _max = value.max()  # df['Value'].max()
+
+    # Let's compute heights: they are a conversion of each item value in those new coordinates
+    # In our example, 0 in the dataset will be converted to the lowerLimit (10)
+    # The maximum will be converted to the upperLimit (100)
+    slope = (_max - lower_limit) / _max
+    heights = slope * value + lower_limit
+
+    # Compute the width of each bar. In total we have 2*Pi = 360°
+    width = 2 * np.pi / len(value)
+
+    # Compute the angle each bar is centered on:
+    angles = np.arange(1, len(value) + 1) * width
+
+    # Labels are rotated. Rotation must be specified in degrees :(
+    # Flip the labels on the left half upside down
+    flip = (angles >= np.pi / 2) & (angles < 3 * np.pi / 2)
+    rotations = np.rad2deg(angles)
+    rotations = np.where(flip, rotations + 180, rotations)
+    return heights, angles, width, rotations, flip
+
+
 def plot_circular_bar(
         metrics: dict,
         show=False,
@@ -188,9 +222,13 @@ def plot_circular_bar(
         linewidth:
         edgecolor:
         color:
+        compress_level: zlib compression level (0-9) used when saving the png
+            file. Lower values write faster but produce larger files.
     :return:
     """
 
+    import matplotlib.pyplot as plt
+
     # initialize the figure
     plt.close('all')
     plt.figure(figsize=kwargs.get('figsize', (8, 12)))
@@ -200,29 +238,17 @@ def plot_circular_bar(
     # Set the coordinates limits
     # upperLimit = 100
     lower_limit = 30
-    value = np.array(list(metrics.values()))
-
-    lower = round(np.min(list(metrics.values())), 4)
-    upper = round(np.max(list(metrics.values())), 4)
-
-    # Compute max and min in the dataset
-    _max = max(value)  # df['Value'].max()
+    n = len(metrics)
+    names = list(metrics.keys())
+    value = np.fromiter(metrics.values(), dtype=np.float64, count=n)
 
-    # Let's compute heights: they are a conversion of each item value in those new coordinates
-    # In our example, 0 in the dataset will be converted to the lowerLimit (10)
-    # The maximum will be converted to the upperLimit (100)
-    slope = (_max - lower_limit) / _max
-    heights = slope * value + lower_limit
+    lower = round(value.min(), 4)
+    upper = round(value.max(), 4)
 
-    # Compute the width of each bar. In total we have 2*Pi = 360°
-    width = 2 * np.pi / len(metrics)
-
-    # Compute the angle each bar is centered on:
-    indexes = list(range(1, len(metrics) + 1))
-    angles = [element * width for element in indexes]
+    heights, angles, width, rotations, flip = _polar_layout(value, lower_limit)
 
     # Draw bars
-    bars = ax.bar(
+    ax.bar(
         x=angles,
         height=heights,
         width=width,
@@ -242,26 +268,15 @@ def plot_circular_bar(
         # 'nse': "NSE"
     }
 
-    # Add labels
-    for bar, angle, label1, label2 in zip(bars, angles, metrics.keys(), metrics.values()):
-
-        label1 = metric_names.get(label1, label1)
-        label = f'{label1} {round(label2, 4)}'
-
-        # Labels are rotated. Rotation must be specified in degrees :(
-        rotation = np.rad2deg(angle)
-
-        # Flip some labels upside down
-        if angle >= np.pi / 2 and angle < 3 * np.pi / 2:
-            alignment = "right"
-            rotation = rotation + 180
-        else:
-            alignment = "left"
+    alignments = np.where(flip, "right", "left")
+    labels = [f'{metric_names.get(name, name)} {val}' for name, val in zip(names, np.round(value, 4))]
+    label_y = lower_limit + heights + label_padding
 
-        # Finally add the labels
+    # Add labels
+    for angle, y, label, alignment, rotation in zip(angles, label_y, labels, alignments, rotations):
         ax.text(
             x=angle,
-            y=lower_limit + bar.get_height() + label_padding,
+            y=y,
             s=label,
             ha=alignment,
             va='center',
@@ -272,22 +287,44 @@ def plot_circular_bar(
         fname = f"{len(metrics)}_bar_errors_from_{lower}_to_{upper}.png"
         if save_path is not None:
             fname = os.path.join(save_path, fname)
-        plt.savefig(fname, dpi=400, bbox_inches='tight')
+        plt.savefig(fname, dpi=400, bbox_inches='tight',
+                    pil_kwargs={"compress_level": kwargs.get('compress_level', 1)})
     if show:
         plt.show()
 
     return
 
 
-def plot1d(true, predicted, save=True, name="plot", show=False):
+def _downsample(y, n_out: int = 2000):
+    """returns the indices and values of y after reducing it to n_out points.
+    LTTB is used when tsdownsample is installed, otherwise evenly spaced points
+    are taken."""
+    y = np.asarray(y)
+    if len(y) <= n_out:
+        return np.arange(len(y)), y
+
+    if LTTBDownsampler is not None and y.size == len(y):
+        idx = LTTBDownsampler().downsample(np.ascontiguousarray(y.reshape(-1), dtype=np.float64), n_out=n_out)
+    else:
+        idx = np.unique(np.linspace(0, len(y) - 1, n_out).astype(np.int64))
+    return idx, y[idx]
+
+
+def plot1d(true, predicted, save=True, name="plot", show=False, compress_level=1,
+           max_points: int = 10_000):
+    import matplotlib.pyplot as plt
+
     _, axis = plt.subplots()
 
-    axis.plot(np.arange(len(true)), true, label="True")
-    axis.plot(np.arange(len(predicted)), predicted, label="Predicted")
+    # series longer than max_points are reduced to 2000 points before plotting
+    axis.plot(*_downsample(true, 2000 if len(true) > max_points else len(true)), label="True")
+    axis.plot(*_downsample(predicted, 2000 if len(predicted) > max_points else len(predicted)),
+              label="Predicted")
     axis.legend(loc="best")
 
     if save:
-        plt.savefig(name, dpi=300, bbox_inches='tight')
+        plt.savefig(name, dpi=300, bbox_inches='tight',
+                    pil_kwargs={"compress_level": compress_level})
     if show:
         plt.show()
 
@@ -1,15 +1,25 @@
 import os
 from typing import Union
+from functools import lru_cache
+from importlib.util import find_spec
 
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
+from joblib import Parallel, delayed
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from concurrent.futures import ProcessPoolExecutor
 
 try:
     import lime
 except ModuleNotFoundError:
     lime = None
 
+try:
+    import imageio
+except ModuleNotFoundError:
+    imageio = None
+
 from ._explain import ExplainerMixin
 
 
@@ -31,6 +41,9 @@ class LimeExplainer(ExplainerMixin):
 
     Attributes:
         explaination_objects : location explaination objects for each individual example/instance
+        weights : array of shape (examples, features) with the local weight of
+            each feature for each example. Only filled when ``lightweight`` is True.
+            The features not selected in an explanation are nan.
     """
     def __init__(
             self,
@@ -44,6 +57,8 @@ class LimeExplainer(ExplainerMixin):
             verbosity: Union[int, bool] = True,
             save: bool = True,
             show: bool = True,
+            sampling: str = "gaussian",
+            lightweight: bool = False,
             **kwargs
     ):
         """
@@ -70,6 +85,15 @@ class LimeExplainer(ExplainerMixin):
                 whether to show the plot or not
             save:
                 whether to save the plot or not
+            sampling :
+                either ``gaussian`` or ``lhs``. If ``lhs``, the perturbed samples of
+                LimeTabularExplainer are drawn using Latin hypercube sampling which
+                covers the feature space more evenly than random sampling and
+                therefore requires smaller ``num_samples`` for stable explanations.
+            lightweight :
+                If True, the explanation objects are not kept in ``explaination_objects``.
+                Only the weights of the features are stored in the ``weights`` array,
+                which saves memory when explaining a large number of examples.
         """
         self.model = model
         self.train_data = to_np(train_data)
@@ -82,9 +106,16 @@ class LimeExplainer(ExplainerMixin):
 
         self.mode = mode
         self.verbosity = verbosity
+        assert sampling in ("gaussian", "lhs"), f"sampling must be gaussian or lhs but it is {sampling}"
+        self.sampling = sampling
         self.explainer = self._get_explainer(explainer, **kwargs)
 
         self.explaination_objects = {}
+        self.lightweight = lightweight
+        self.weights = None
+        if lightweight:
+            self.weights = np.full((len(self.data), len(self.features)), np.nan, dtype=np.float32)
+        self._ax = None
 
     @property
     def mode(self):
@@ -101,7 +132,10 @@ class LimeExplainer(ExplainerMixin):
         import lime.lime_tabular
 
         if proposed_explainer is None and self.data.ndim <= 2:
-            lime_explainer = lime.lime_tabular.LimeTabularExplainer(
+            explainer = lime.lime_tabular.LimeTabularExplainer
+            if self.sampling == "lhs":
+                explainer = _lhs_explainer()
+            lime_explainer = explainer(
                 self.train_data,
                 feature_names=self.features,
                 # class_names=['price'],
@@ -147,6 +181,11 @@ class LimeExplainer(ExplainerMixin):
                              plot_type="pyplot",
                              name="lime_explaination",
                              num_features=None,
+                             num_samples: int = 1000,
+                             n_jobs: int = 1,
+                             sink: str = "plot",
+                             colors=None,
+                             annotate=False,
                              **kwargs
                              ):
         """
@@ -156,13 +195,75 @@ class LimeExplainer(ExplainerMixin):
             plot_type :
             name :
             num_features :
+            num_samples :
+                size of the neighborhood used to learn the linear model of
+                each example. See :py:meth:`explain_example`.
+            n_jobs :
+                number of processes in which the examples are explained. -1 means
+                all the cores. The plots are always drawn in the main process.
+            sink :
+                either ``plot`` or ``parquet``. If ``parquet``, no plots are drawn
+                and the weights of all the examples are written once after the loop
+                in ``{name}.parquet`` with columns instance_index, feature and weight.
+            colors :
+                colors of the bars. See :py:meth:`explain_example`.
+            annotate :
+                whether to annotate the figures or not
             kwargs : any keyword argument for `explain_instance`
 
         An example here means an instance/sample/data point.
         """
-        for i in range(len(self.data)):
-            self.explain_example(i, plot_type=plot_type, name=f"{name}_{i}",
-                                 num_features=num_features, **kwargs)
+        assert sink in ("plot", "parquet"), f"sink must be plot or parquet but it is {sink}"
+        if sink == "parquet" and not any(find_spec(engine) for engine in ("pyarrow", "fastparquet")):
+            # checked before the examples are explained
+            raise ImportError('sink="parquet" requires pyarrow or fastparquet to be installed')
+
+        if n_jobs == 1:
+            # explained one by one while the previous plot is being saved
+            explanations = (_explain_one(self.explainer, self.data[i], _predict_fn(self.model, self.mode),
+                                         num_features or len(self.features), num_samples, kwargs)
+                            for i in range(len(self.data)))
+        else:
+            explanations = Parallel(n_jobs=n_jobs, backend="loky")(
+                delayed(_explain_one)(self.explainer, self.data[i], _predict_fn(self.model, self.mode),
+                                      num_features or len(self.features), num_samples, kwargs)
+                for i in range(len(self.data)))
+
+        if sink == "parquet":
+            rows = []
+            for i, exp in enumerate(explanations):
+                self._store(i, exp)
+                rows += [(i, feature, weight) for feature, weight in exp.as_list(label=1)]
+
+            pd.DataFrame(rows, columns=["instance_index", "feature", "weight"]).to_parquet(
+                os.path.join(self.path, f"{name}.parquet"))
+            return
+
+        # the figures are drawn and written to disk by a background process
+        writer = None
+        if plot_type == "pyplot" and self.save and not self.show and len(self.data) > 1:
+            writer = ProcessPoolExecutor(max_workers=1, initializer=_use_agg)
+
+        futures = []
+        for i, exp in enumerate(explanations):
+            self._store(i, exp)
+            if writer is None:
+                # the same axes is redrawn for every example
+                self._plot(exp, i, plot_type=plot_type, name=f"{name}_{i}", colors=colors,
+                           annotate=annotate, ax=self._get_axes())
+            else:
+                futures.append(writer.submit(
+                    _save_bar_figure,
+                    os.path.join(self.path, f"{name}_{i}_{i}"),
+                    exp.as_list(label=1),
+                    _title(exp, example_index=i),
+                    colors,
+                    _textstr(exp, annotate)))
+
+        if writer is not None:
+            for future in futures:
+                future.result()
+            writer.shutdown()
         return
 
     def explain_example(
@@ -171,8 +272,10 @@ class LimeExplainer(ExplainerMixin):
             plot_type: str = "pyplot",
             name: str = "lime_explaination",
             num_features: int = None,
+            num_samples: int = 1000,
             colors=None,
             annotate=False,
+            return_array: bool = False,
             **kwargs
     )->plt.Figure:
         """
@@ -183,29 +286,53 @@ class LimeExplainer(ExplainerMixin):
             plot_type : either pyplot or html
             name : name with which to save the file
             num_features :
+            num_samples :
+                size of the neighborhood i.e. the number of perturbed samples
+                for which the model makes predictions. The time taken to explain
+                an example grows linearly with it. Larger values give more stable
+                explanations. LIME uses 5000 by default.
             colors :
             annotate : whether to annotate figure or not
+            return_array : if True, the pyplot figure is rendered in memory and
+                returned as a numpy array of shape (height, width, 4). If save is
+                True, this array is written as png with imageio instead of
+                ``plt.savefig``.
             kwargs : any keyword argument for `explain_instance`
 
         Returns:
-            matplotlib figure if plot_type="pyplot" and show is False.
+            matplotlib figure if plot_type="pyplot" and show is False or rgba
+            array if return_array is True. Every call draws a new figure, which
+            is not closed when it is returned.
         """
         assert plot_type in ("pyplot", "html")
 
-        exp = self.explainer.explain_instance(self.data[index],
-                                              self.model.predict,
-                                              num_features=num_features or len(self.features),
-                                              **kwargs
-                                              )
+        exp = _explain_one(self.explainer, self.data[index], _predict_fn(self.model, self.mode),
+                           num_features or len(self.features), num_samples, kwargs)
 
-        self.explaination_objects[index] = exp
+        self._store(index, exp)
 
+        return self._plot(exp, index, plot_type=plot_type, name=name, colors=colors,
+                          annotate=annotate, return_array=return_array)
+
+    def _plot(self, exp, index, plot_type="pyplot", name="lime_explaination",
+              colors=None, annotate=False, return_array=False, ax=None):
+        """draws on ax if given, otherwise on a new figure"""
         fig = None
         if plot_type == "pyplot":
-            plt.close()
-            fig = as_pyplot_figure(exp, colors=colors, example_index=index, annotate=annotate)
+            fig = as_pyplot_figure(exp, colors=colors, example_index=index, annotate=annotate,
+                                   ax=ax)
+            if return_array:
+                fig.tight_layout()
+                img = _figure_to_array(fig)
+                if ax is None:
+                    plt.close(fig)
+                if self.save:
+                    _imsave(os.path.join(self.path, f"{name}_{index}.png"), img)
+                return img
             if self.save:
-                plt.savefig(os.path.join(self.path, f"{name}_{index}"), bbox_inches="tight")
+                # cheaper than bbox_inches="tight" which renders the figure twice
+                fig.tight_layout()
+                fig.savefig(os.path.join(self.path, f"{name}_{index}"))
             if self.show:
                 plt.show()
         else:
@@ -213,6 +340,97 @@ class LimeExplainer(ExplainerMixin):
 
         return fig
 
+    def _store(self, index, exp):
+        if self.lightweight:
+            # the heavy explanation object is dropped after plotting
+            features, weights = zip(*exp.local_exp[_label(exp)])
+            self.weights[index, list(features)] = weights
+        else:
+            self.explaination_objects[index] = exp
+        return
+
+    def _get_axes(self) -> plt.Axes:
+        """returns the axes which is reused for drawing every example by
+        explain_all_examples. A new one is created if the figure has been
+        closed e.g. by closing its window."""
+        if self._ax is None or not plt.fignum_exists(self._ax.figure.number):
+            _, self._ax = plt.subplots()
+        return self._ax
+
+
+class _LatinHypercubeState(object):
+    """Used as random state of LimeTabularExplainer while it draws the perturbed
+    samples. The normal and the categorical draws are made using Latin hypercube
+    sampling, everything else is delegated to the original random state."""
+    def __init__(self, random_state, num_samples: int):
+        self.random_state = random_state
+        self.num_samples = num_samples
+
+    def _uniform(self, n: int, d: int) -> np.ndarray:
+        from scipy.stats import qmc
+        return qmc.LatinHypercube(d=d, seed=self.random_state).random(n)
+
+    def normal(self, loc=0.0, scale=1.0, size=None):
+        from scipy.stats import norm
+        # LimeTabularExplainer draws num_samples * num_features values and
+        # reshapes them to (num_samples, num_features)
+        num_cols = size // self.num_samples
+        u = self._uniform(self.num_samples, num_cols)
+        return (norm.ppf(u) * scale + loc).reshape(-1, )
+
+    def choice(self, a, size=None, replace=True, p=None):
+        u = self._uniform(size, 1)[:, 0]
+        cum_p = np.cumsum(p if p is not None else np.ones(len(a)) / len(a))
+        idx = np.minimum(np.searchsorted(cum_p / cum_p[-1], u, side="right"), len(a) - 1)
+        return np.asarray(a)[idx]
+
+    def __getattr__(self, item):
+        return getattr(self.random_state, item)
+
+
+def _lhs_explainer():
+    """LimeTabularExplainer which draws its perturbed samples using Latin hypercube sampling"""
+    from lime.lime_tabular import LimeTabularExplainer
+
+    class LHSTabularExplainer(LimeTabularExplainer):
+
+        def _LimeTabularExplainer__data_inverse(self, data_row, num_samples, *args, **kwargs):
+            random_state = self.random_state
+            self.random_state = _LatinHypercubeState(random_state, num_samples)
+            try:
+                return LimeTabularExplainer._LimeTabularExplainer__data_inverse(
+                    self, data_row, num_samples, *args, **kwargs)
+            finally:
+                self.random_state = random_state
+
+    return LHSTabularExplainer
+
+
+def _predict_fn(model, mode: str):
+    """returns the function which LIME calls with all the perturbed samples of
+    an example. For classification, the probabilities are returned if the model
+    can predict them."""
+    if mode == "classification" and hasattr(model, "predict_proba"):
+        predict = model.predict_proba
+    else:
+        predict = model.predict
+
+    def predict_fn(x):
+        return predict(np.ascontiguousarray(x, dtype=np.float32))
+
+    return predict_fn
+
+
+def _explain_one(explainer, data_row, predict_fn, num_features: int, num_samples: int,
+                 kwargs: dict):
+    """explains one example. It is a module level function so that it can
+    be run in a separate process."""
+    return explainer.explain_instance(data_row,
+                                      predict_fn,
+                                      num_features=num_features,
+                                      num_samples=num_samples,
+                                      **kwargs)
+
 
 def to_np(x) -> np.ndarray:
 
@@ -221,7 +439,9 @@ def to_np(x) -> np.ndarray:
     else:
         assert isinstance(x, np.ndarray)
 
-    return x
+    # halves the memory traffic of perturbing the samples and fitting the
+    # local surrogate model
+    return np.ascontiguousarray(x, dtype=np.float32)
 
 
 def as_pyplot_figure(
@@ -230,6 +450,7 @@ def as_pyplot_figure(
         example_index=None,
         colors: [str, tuple, list] = None,
         annotate=False,
+        ax: plt.Axes = None,
         **kwargs):
     """Returns the explanation as a pyplot figure.
 
@@ -242,42 +463,104 @@ def as_pyplot_figure(
         colors : if tuple it must be names of two colors for +ve and -ve
         example_index :
         annotate : whether to annotate the figure or not?
+        ax : axes to draw on. It is cleared before drawing.
         kwargs: keyword arguments, passed to domain_mapper
 
     Returns:
         pyplot figure (barchart).
     """
-    textstr = f"""Prediction: {round(inst_explainer.predicted_value, 2)}
+    return _bar_figure(inst_explainer.as_list(label=label, **kwargs),
+                       _title(inst_explainer, label, example_index),
+                       colors=colors,
+                       textstr=_textstr(inst_explainer, annotate),
+                       ax=ax)
+
+
+def _label(exp) -> int:
+    # regression explanations are stored under a dummy label
+    return 1 if exp.mode == "classification" else exp.dummy_label
+
+
+def _title(inst_explainer, label=1, example_index=None) -> str:
+    if inst_explainer.mode == "classification":
+        return 'Local explanation for class %s' % inst_explainer.class_names[label]
+    return f'Local explanation for example {example_index}'
+
+
+def _textstr(inst_explainer, annotate=False) -> Union[str, None]:
+    if annotate and inst_explainer.mode == "regression":
+        return f"""Prediction: {round(inst_explainer.predicted_value, 2)}
 Local prediction: {round(inst_explainer.local_pred.item(), 2)}"""
+    return None
 
+
+def _bar_figure(exp: list, title: str, colors=None, textstr: str = None,
+                ax: plt.Axes = None) -> plt.Figure:
+    """draws the explanation given as list of (feature, weight) tuples. If ax
+    is given, it is cleared and reused instead of creating a new figure."""
     if colors is None:
         colors = ([0.9375, 0.01171875, 0.33203125], [0.23828125, 0.53515625, 0.92578125])
     elif isinstance(colors, str):
         colors = (colors, colors)
 
-    exp = inst_explainer.as_list(label=label, **kwargs)
-    fig = plt.figure()
-    vals = [x[1] for x in exp]
-    names = [x[0] for x in exp]
-    vals.reverse()
-    names.reverse()
+    if ax is None:
+        _, ax = plt.subplots()
+    else:
+        ax.clear()
+
+    names, vals = zip(*exp[::-1]) if exp else ((), ())
+    vals = np.array(vals)
 
     if isinstance(colors, tuple):
-        colors = [colors[0] if x > 0 else colors[1] for x in vals]
+        # first color for positive and second for negative weights
+        colors = np.array(colors)[(vals <= 0).astype(np.int64)]
 
-    pos = np.arange(len(exp)) + .5
-    h = plt.barh(pos, vals, align='center', color=colors)
-    plt.yticks(pos, names)
-    if inst_explainer.mode == "classification":
-        title = 'Local explanation for class %s' % inst_explainer.class_names[label]
-    else:
-        title = f'Local explanation for example {example_index}'
-    plt.title(title)
-    plt.grid(linestyle='--', alpha=0.5)
+    pos = _bar_positions(len(exp))
+    h = ax.barh(pos, vals, align='center', color=colors)
+    ax.set_yticks(pos)
+    ax.set_yticklabels(names)
+    ax.set_title(title)
+    ax.grid(linestyle='--', alpha=0.5)
 
-    if annotate:
+    if textstr is not None:
         # https://stackoverflow.com/a/59109053/5982232
-        plt.legend(h, [textstr], loc="best",
-                   fancybox=True, framealpha=0.7,
-                   handlelength=0, handletextpad=0)
-    return fig
+        ax.legend(h, [textstr], loc="best",
+                  fancybox=True, framealpha=0.7,
+                  handlelength=0, handletextpad=0)
+    return ax.figure
+
+
+@lru_cache(maxsize=8)
+def _bar_positions(n: int) -> np.ndarray:
+    pos = np.arange(n) + .5
+    pos.flags.writeable = False
+    return pos
+
+
+def _save_bar_figure(fname: str, exp: list, title: str, colors=None, textstr: str = None):
+    """draws and saves the explanation. It is run in a background process."""
+    fig = _bar_figure(exp, title, colors=colors, textstr=textstr)
+    fig.tight_layout()
+    fig.savefig(fname)
+    plt.close(fig)
+    return
+
+
+def _figure_to_array(fig: plt.Figure) -> np.ndarray:
+    """renders the figure in memory and returns it as rgba array"""
+    canvas = fig.canvas if isinstance(fig.canvas, FigureCanvasAgg) else FigureCanvasAgg(fig)
+    canvas.draw()
+    return np.asarray(canvas.buffer_rgba()).copy()
+
+
+def _imsave(fname: str, img: np.ndarray):
+    if imageio is None:
+        plt.imsave(fname, img)
+    else:
+        imageio.imwrite(fname, img)
+    return
+
+
+def _use_agg():
+    import matplotlib
+    matplotlib.use('Agg')
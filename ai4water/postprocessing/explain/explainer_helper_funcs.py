@@ -2,6 +2,8 @@
 import os
 from typing import Union
 
+import matplotlib.pyplot as plt
+
 from ...preprocessing import DataSet
 from ._shap import ShapExplainer, shap
 from ._lime import LimeExplainer, lime
@@ -124,7 +126,8 @@ def explain_model_with_lime(
                               )
 
     for i in range(explainer.data.shape[0]):
-        explainer.explain_example(i, name=f"lime_exp_for_{index[i]}")
+        # every example is drawn on a new figure
+        plt.close(explainer.explain_example(i, name=f"lime_exp_for_{index[i]}"))
 
     return explainer
 
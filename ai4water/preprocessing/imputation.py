@@ -6,6 +6,13 @@ import matplotlib.pyplot as plt
 
 from ai4water.backend import imputations
 
+try:
+    import numba
+except ModuleNotFoundError:
+    numba = None
+
+prange = range if numba is None else numba.prange
+
 seed = 313
 # use LGBM imputation method
 # https://www.kaggle.com/robikscube/handling-with-missing-data-youtube-stream#Level-4:-LightGBM-Imputer!!
@@ -102,6 +109,15 @@ class Imputation(object):
         self.imputer_args = {} if imputer_args is None else imputer_args
         self.new_data = None
 
+    @property
+    def features(self):
+        return self._features
+
+    @features.setter
+    def features(self, x):
+        self._features = x
+        self._feature_set = set(x)
+
     @property
     def method(self):
         return self._method
@@ -123,22 +139,37 @@ class Imputation(object):
         else:
             kwargs = self.imputer_args
 
-        if self.method in ['fillna', 'interpolate']:  # it is a pandas based
-            for col in self.data.columns:
-                if col in self.features:
+        builtin = self.method in ['fillna', 'interpolate'] or self.method in imputations
+
+        if builtin and not self.data[self.features].isna().to_numpy().any():
+            pass  # nothing to impute, so the imputer is not even built
+
+        elif numba is not None and self.method == 'fillna' and kwargs == {'method': 'ffill'} \
+                and all(pd.api.types.is_float_dtype(self.data[col]) for col in self.features):
+            # a single compiled pass over all the features
+            features = list(self.features)
+            arr = np.array(self.data[features].values, dtype=np.float64, order='F')
+            self.data[features] = _ffill_2d(arr)
+
+        elif self.method in ['fillna', 'interpolate']:  # it is a pandas based
+            features = [col for col in self.data.columns if col in self._feature_set]
+            try:
+                # a single call for all the features
+                self.data[features] = getattr(self.data[features], self.method)(**kwargs)
+            except NotImplementedError:
+                # some arguments are only supported for Series
+                for col in features:
                     self.data[col] = getattr(self.data[col], self.method)(**kwargs)
 
         elif self.method in imputations:
             imputer = imputations[self.method](**kwargs)
 
             data = self.data.copy()  # making a copy so that non-imputed features remain intact
-            _data = self.data[self.features].values
+            _data = np.ascontiguousarray(self.data[self.features].values)
             data_ = imputer.fit_transform(_data)
 
-            if isinstance(data_, np.ndarray):
-                data_ = pd.DataFrame(data_, columns=self.features, index=self.data.index)
-
-            data[self.features] = data_
+            # the array is assigned directly without reboxing it in a DataFrame
+            data.loc[:, self.features] = data_
 
             setattr(self, 'data', data)
 
@@ -193,20 +224,19 @@ class Imputation(object):
 
     def missing_indices(self) -> dict:
         # https://github.com/scikit-learn/scikit-learn/blob/7cc3dbcbe/sklearn/impute/_base.py#L556
-        indices = {}
-        for col in self.data.columns:
-            # https://stackoverflow.com/a/42795371/5982232
-            indices[col] = np.isnan(self.data[col].values.astype(float))
+        # a single isnan pass over the whole frame instead of one per column
+        # https://stackoverflow.com/a/42795371/5982232
+        mask = np.isnan(self.data.to_numpy(dtype=float, copy=False))
 
-        return indices
+        return {col: mask[:, i] for i, col in enumerate(self.data.columns)}
 
     def maybe_make_df(self, data):
         setattr(self, '_dtype', data.__class__.__name__)
 
-        data = data.copy()
-
         if isinstance(data, pd.DataFrame):
-            data = data
+            # columns are only ever replaced by assignment, so the user's
+            # data remains intact without copying the underlying arrays
+            data = data.copy(deep=False)
         else:
             data = np.array(data)
             if data.ndim == 1:
@@ -214,3 +244,19 @@ class Imputation(object):
             assert isinstance(data, np.ndarray)
             data = pd.DataFrame(data, columns=['data'+str(i) for i in range(data.shape[1])])
         return data
+
+
+def _ffill_2d(arr):
+    """forward fills the nans in each column of a 2d float array in place"""
+    for j in prange(arr.shape[1]):
+        last = np.nan
+        for i in range(arr.shape[0]):
+            if np.isnan(arr[i, j]):
+                arr[i, j] = last
+            else:
+                last = arr[i, j]
+    return arr
+
+
+if numba is not None:
+    _ffill_2d = numba.njit(parallel=True, cache=True)(_ffill_2d)
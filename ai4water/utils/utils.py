@@ -96,12 +96,9 @@ def maybe_create_path(prefix=None, path=None):
     else:
         save_dir = path
 
-    if not os.path.exists(save_dir):
-        os.makedirs(save_dir)
-
-    for _dir in ['weights']:
-        if not os.path.exists(os.path.join(save_dir, _dir)):
-            os.makedirs(os.path.join(save_dir, _dir))
+    # creating the sub-directories also creates save_dir
+    for _dir in ('weights',):
+        os.makedirs(os.path.join(save_dir, _dir), exist_ok=True)
 
     return save_dir
 
@@ -111,16 +108,7 @@ def dateandtime_now() -> str:
     Returns the datetime in following format as string
     YYYYMMDD_HHMMSS
     """
-    jetzt = datetime.datetime.now()
-    dt = ''
-    for time in ['year', 'month', 'day', 'hour', 'minute', 'second']:
-        _time = str(getattr(jetzt, time))
-        if len(_time) < 2:
-            _time = '0' + _time
-        if time == 'hour':
-            _time = '_' + _time
-        dt += _time
-    return dt
+    return datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
 
 
 def dict_to_file(path, config=None, errors=None, indices=None, others=None, name=''):
@@ -129,13 +117,7 @@ def dict_to_file(path, config=None, errors=None, indices=None, others=None, name
     if errors is not None:
         suffix = dateandtime_now()
         fpath = path + "/errors_" + name + suffix + ".json"
-        # maybe some errors are not json serializable.
-        for er_name, er_val in errors.items():
-            if "int" in er_val.__class__.__name__:
-                errors[er_name] = int(er_val)
-            elif "float" in er_val.__class__.__name__:
-                errors[er_name] = float(er_val)
-
+        # numpy scalars among errors are handled by JsonEncoder
         data = errors
     elif config is not None:
         fpath = path + "/config.json"
@@ -646,6 +628,16 @@ def to_datetime_index(idx_array, fmt='%Y%m%d%H%M') -> pd.DatetimeIndex:
     return idx
 
 
+def _native_number(obj):
+    """converts python and numpy numbers to python int/float, otherwise returns None.
+    Checking the type is cheaper than looking for 'int'/'float' in the class name."""
+    if isinstance(obj, (float, np.floating)):
+        return float(obj)
+    if isinstance(obj, (int, np.integer)) and not isinstance(obj, bool):
+        return int(obj)
+    return None
+
+
 class Jsonize(object):
     """Converts the objects to json compatible format i.e to native python types.
     If the object is sequence then each member of the sequence is checked and
@@ -668,6 +660,9 @@ class Jsonize(object):
 
     def __call__(self):
         """Serializes one object"""
+        number = _native_number(self.obj)
+        if number is not None:
+            return number
         if 'int' in self.obj.__class__.__name__:
             return int(self.obj)
         if 'float' in self.obj.__class__.__name__:
@@ -696,9 +691,13 @@ class Jsonize(object):
 
     def stage2(self, obj):
         """Serializes one object"""
-        if any([isinstance(obj, _type) for _type in [bool, set, type(None)]]) or callable(obj):
+        if isinstance(obj, (bool, set, type(None))) or callable(obj):
             return obj
 
+        number = _native_number(obj)
+        if number is not None:
+            return number
+
         if 'int' in obj.__class__.__name__:
             return int(obj)
 
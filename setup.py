@@ -17,7 +17,7 @@ min_requirements = [
     'pandas',
     'matplotlib',
     'scikit-optimize',
-    'joblib',
+    'joblib>=1.3',  # Parallel(return_as="generator")
     'requests',
     'easy_mpl>=0.20.4',
     'SeqMetrics>=1.3.3'
@@ -45,6 +45,71 @@ class TestExperiments(unittest.TestCase):
         self.assertGreater(len(best_models), 1), len(best_models)
         return
 
+    def test_dryrun_parallel(self):
+
+        comparisons = MLRegressionExperiments(
+            input_features=input_features, output_features=outputs,
+            nan_filler={'method': 'SimpleImputer', 'imputer_args': {'strategy': 'mean'},
+                        'features': input_features},
+            verbosity=0
+        )
+        include = ['RandomForestRegressor', 'LinearRegression', 'KNeighborsRegressor']
+        comparisons.fit(data=df, include=include, n_jobs=2)
+        self.assertEqual(len(comparisons.metrics), 3)
+        self.assertEqual(len(comparisons.config['eval_models']), 3)
+        comparisons.compare_errors('r2', show=False)
+        return
+
+    def test_dryrun_subsample(self):
+
+        comparisons = MLRegressionExperiments(
+            input_features=input_features, output_features=outputs,
+            nan_filler={'method': 'SimpleImputer', 'imputer_args': {'strategy': 'mean'},
+                        'features': input_features},
+            verbosity=0
+        )
+        include = ['LinearRegression', 'KNeighborsRegressor']
+        comparisons.fit(data=df, include=include, dry_run_subsample=1000)
+        self.assertEqual(len(comparisons.metrics), 2)
+        self.assertEqual(len(comparisons.model_.dh_.data), 1000)
+        return
+
+    def test_halving(self):
+
+        comparisons = MLRegressionExperiments(
+            input_features=input_features, output_features=outputs,
+            nan_filler={'method': 'SimpleImputer', 'imputer_args': {'strategy': 'mean'},
+                        'features': input_features},
+            verbosity=0
+        )
+
+        include = ['RandomForestRegressor', 'LinearRegression', 'DummyRegressor',
+                   'KNeighborsRegressor', 'Lasso']
+        comparisons.fit(data=df, run_type="halving", include=include, eta=2)
+        # 5 models -> 2 -> 1
+        self.assertEqual(len(comparisons.halving_scores_), 3)
+        self.assertEqual(len(comparisons.metrics), 1)
+        comparisons.compare_errors('r2', show=False)
+        return
+
+    def test_hyperband(self):
+
+        comparisons = MLRegressionExperiments(
+            input_features=input_features, output_features=outputs,
+            nan_filler={'method': 'SimpleImputer', 'imputer_args': {'strategy': 'mean'},
+                        'features': input_features},
+            verbosity=0
+        )
+
+        include = ['RandomForestRegressor', 'LinearRegression', 'DummyRegressor',
+                   'KNeighborsRegressor', 'Lasso']
+        comparisons.fit(data=df, run_type="hyperband", include=include, eta=2,
+                        max_resource=4)
+        # brackets s=2, 1 and 0
+        self.assertEqual(len(comparisons.hyperband_scores_), 3)
+        self.assertIn(comparisons.hyperband_best_[0], comparisons.metrics)
+        return
+
     def test_optimize(self):
         best_models = ['GaussianProcessRegressor',
                        #'HistGradientBoostingRegressor',
@@ -70,6 +135,19 @@ class TestExperiments(unittest.TestCase):
         comparisons.compare_convergence()
         return
 
+    def test_optimize_pruning(self):
+
+        comparisons = MLRegressionExperiments(
+            input_features=input_features, output_features=outputs,
+            nan_filler={'method': 'SimpleImputer', 'imputer_args':  {'strategy': 'mean'},
+                        'features': input_features},
+            verbosity=0)
+        comparisons.fit(data=df, run_type="optimize", opt_method="random",
+                        num_iterations=8, include=['HistGradientBoostingRegressor'],
+                        post_optimize='train_best', prune_trials=True)
+        self.assertIn('model_HistGradientBoostingRegressor', comparisons.metrics)
+        return
+
     def test_cross_val(self):
 
         comparisons = MLRegressionExperiments(
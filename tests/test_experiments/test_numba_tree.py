@@ -0,0 +1,79 @@
+import unittest
+
+import numpy as np
+from sklearn.tree import DecisionTreeRegressor
+
+from ai4water.experiments import _numba_tree
+from ai4water.experiments._numba_tree import NumbaDecisionTreeRegressor
+
+
+rng = np.random.default_rng(313)
+x = rng.random((200, 4))
+y = x[:, 0] * 3 + np.sin(x[:, 1] * 6) + x[:, 2] ** 2 + rng.normal(0, 0.1, 200)
+x_test = rng.random((50, 4))
+
+
+@unittest.skipIf(_numba_tree.numba is None, "numba is not installed")
+class TestNumbaTree(unittest.TestCase):
+
+    def check_parity(self, check_test=True, **kwargs):
+        tree = NumbaDecisionTreeRegressor(**kwargs).fit(x, y)
+        sk_tree = DecisionTreeRegressor(random_state=313, **kwargs).fit(x, y)
+
+        np.testing.assert_allclose(tree.predict(x), sk_tree.predict(x))
+        self.assertEqual(tree.max_depth_, sk_tree.get_depth())
+        self.assertEqual((tree.tree_['left'] < 0).sum(), sk_tree.get_n_leaves())
+        if check_test:
+            # in small nodes, several features can give the same split of the
+            # training samples and the two trees may choose different ones
+            np.testing.assert_allclose(tree.predict(x_test), sk_tree.predict(x_test))
+        return tree
+
+    def test_max_depth(self):
+        for max_depth in [1, 3]:
+            self.check_parity(max_depth=max_depth)
+        for max_depth in [6, None]:
+            self.check_parity(check_test=False, max_depth=max_depth)
+        return
+
+    def test_min_samples_split(self):
+        self.check_parity(check_test=False, min_samples_split=5)
+        self.check_parity(min_samples_split=20)
+        return
+
+    def test_min_samples_leaf(self):
+        for min_samples_leaf in [3, 10]:
+            tree = self.check_parity(min_samples_leaf=min_samples_leaf)
+            leaf_sizes = np.bincount(tree.apply(x))
+            assert leaf_sizes[leaf_sizes > 0].min() >= min_samples_leaf
+        return
+
+    def test_min_weight_fraction_leaf(self):
+        tree = self.check_parity(min_weight_fraction_leaf=0.05)
+        leaf_sizes = np.bincount(tree.apply(x))
+        assert leaf_sizes[leaf_sizes > 0].min() >= 10
+        return
+
+    def test_max_features(self):
+        tree = NumbaDecisionTreeRegressor()
+        for max_features, n in [(None, 4), ("auto", 4), ("sqrt", 2), ("log2", 2), (0.5, 2), (3, 3), (10, 4)]:
+            tree.max_features = max_features
+            self.assertEqual(tree._num_features(4), n)
+
+        p1 = NumbaDecisionTreeRegressor(max_features=2, random_state=313).fit(x, y).predict(x_test)
+        p2 = NumbaDecisionTreeRegressor(max_features=2, random_state=313).fit(x, y).predict(x_test)
+        np.testing.assert_array_equal(p1, p2)
+        # selecting features randomly must not prevent the tree from fitting the data
+        p3 = NumbaDecisionTreeRegressor(max_features=2, random_state=313).fit(x, y).predict(x)
+        np.testing.assert_allclose(p3, y)
+        return
+
+    def test_2d_target(self):
+        p1 = NumbaDecisionTreeRegressor(max_depth=3).fit(x, y.reshape(-1, 1)).predict(x_test)
+        p2 = NumbaDecisionTreeRegressor(max_depth=3).fit(x, y).predict(x_test)
+        np.testing.assert_array_equal(p1, p2)
+        return
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,9 @@
 import os
+import json
 import time
 import pickle
+import tempfile
+import datetime
 import unittest
 import site
 ai4_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -31,6 +34,7 @@ from ai4water.utils.utils import Jsonize
 from ai4water.datasets import busan_beach
 from ai4water.postprocessing.SeqMetrics import RegressionMetrics
 from ai4water.hyperopt import HyperOpt, Real, Categorical, Integer
+from ai4water.hyperopt import _main as hpo_main
 
 if tf is not None:
     if 230 <= int(''.join(tf.__version__.split('.')[0:2]).ljust(3, '0')) < 250:
@@ -77,6 +81,20 @@ prev_xy = {'213026901362135.5_0': {'booster': 'gbtree',
                                     'n_estimators': 17,
                                     'learning_rate': 0.054629143096849984}}
 
+class _Calls:
+    # counts the calls of objective_fn. The class is pickled by reference, so
+    # changing its attributes does not change the fingerprint of objective_fn
+    n = 0
+    interrupt_at = None
+
+
+def counted_objective(**kwargs):
+    _Calls.n += 1
+    if _Calls.n == _Calls.interrupt_at:
+        raise RuntimeError("interrupted")
+    return (kwargs['x'] - 0.3) ** 2
+
+
 def check_attrs(optimizer, paras):
     optimizer.eval_with_best()
     space = optimizer.space()
@@ -286,6 +304,106 @@ class TestHyperOpt(unittest.TestCase):
         assert len(sr) == 20
         return
 
+    def test_grid_custom_model_parallel(self):
+        def f(x, noise_level=0.1):
+            return np.sin(5 * x) * (1 - np.tanh(x ** 2))
+
+        opt = HyperOpt("grid",
+                       objective_fn=f,
+                       param_space=[Real(low=-2.0, high=2.0, num_samples=20)],
+                       n_jobs=2,
+                       verbosity=0
+                       )
+
+        sr = opt.fit()
+        assert len(sr) == 20
+        return
+
+    def test_eval_with_top_k(self):
+        def f(**kwargs):
+            return (kwargs['x'] - 0.3) ** 2
+
+        opt = HyperOpt("grid",
+                       objective_fn=f,
+                       param_space=[Real(low=0.0, high=1.0, num_samples=11, name='x')],
+                       verbosity=0
+                       )
+        opt.fit()
+        errors = opt.eval_with_best(top_k=3, n_repeats=2, n_jobs=2)
+        assert len(errors) == 6
+        assert errors == sorted(errors)
+        return
+
+    def test_replay_interrupted_run(self):
+        """the errors of a run, which was interrupted, are used by the next run"""
+        path = tempfile.mkdtemp()
+
+        def run(interrupt_at=None, persist_cache=True):
+            _Calls.n, _Calls.interrupt_at = 0, interrupt_at
+            opt = HyperOpt("grid",
+                           objective_fn=counted_objective,
+                           param_space=[Real(low=0.0, high=1.0, num_samples=11, name='x')],
+                           opt_path=path,
+                           persist_cache=persist_cache,
+                           verbosity=0
+                           )
+            opt.fit()
+            return opt
+
+        self.assertRaises(RuntimeError, run, 6)
+        assert os.path.exists(os.path.join(path, "eval_results.jsonl"))
+        opt = run()
+        assert _Calls.n == 6  # 5 trials of the interrupted run are not evaluated again
+        assert opt.best_paras()['x'] == np.linspace(0.0, 1.0, 11)[3]
+
+        run()
+        assert _Calls.n == 0
+
+        # without persist_cache, nothing is read or written
+        path = tempfile.mkdtemp()
+        run(persist_cache=False)
+        assert _Calls.n == 11
+        assert not os.path.exists(os.path.join(path, "eval_results.jsonl"))
+        return
+
+    def test_best_of_current_run(self):
+        """the errors saved by a previous run in the same opt_path must not
+        decide the best parameters of the current run"""
+        def f(**kwargs):
+            return (kwargs['x'] - 0.3) ** 2
+
+        path = tempfile.mkdtemp()
+        for low, high in [(0.0, 1.0), (2.0, 3.0)]:
+            opt = HyperOpt("grid",
+                           objective_fn=f,
+                           param_space=[Real(low=low, high=high, num_samples=11, name='x')],
+                           opt_path=path,
+                           persist_cache=True,
+                           verbosity=0
+                           )
+            opt.fit()
+            assert low <= opt.best_paras()['x'] <= high
+            assert all(low <= p['x'] <= high for p in opt._top_paras(3))
+        return
+
+    def test_best_paras_not_rounded(self):
+        """best parameters must be the ones which were evaluated and not
+        the rounded values used to find the already evaluated parameters"""
+        def f(**kwargs):
+            return (kwargs['x'] - 0.3) ** 2
+
+        opt = HyperOpt("grid",
+                       objective_fn=f,
+                       param_space=[Real(low=0.0, high=1.0, num_samples=4, name='x')],
+                       verbosity=0
+                       )
+        opt.fit()
+        assert opt.best_paras()['x'] == 1 / 3
+        assert opt.eval_with_best() == f(x=1 / 3)
+        assert opt._top_paras(2)[1]['x'] == 0.0
+        assert opt.eval_with_best(top_k=2) == [f(x=1 / 3), f(x=0.0)]
+        return
+
     def test_named_custom_bayes(self):
         dims = [Integer(low=10, high=20, name='n_estimators'),
                 Real(low=1e-5, high=0.1, name='learning_rate'),
@@ -334,6 +452,54 @@ class TestHyperOpt(unittest.TestCase):
         check_attrs(opt, len(dims))
         return
 
+    def test_bayes_gbrt_surrogate(self):
+        def f(**kwargs):
+            return (kwargs['x'] - 0.3) ** 2
+
+        opt = HyperOpt("bayes",
+                       objective_fn=f,
+                       param_space=[Real(low=0.0, high=1.0, name='x')],
+                       surrogate='gbrt',
+                       n_calls=15,
+                       verbosity=0
+                       )
+        sr = opt.fit()
+        assert len(sr.func_vals) == 15
+        return
+
+    def test_bayes_warm_start(self):
+        def f(**kwargs):
+            return (kwargs['x'] - 0.3) ** 2
+
+        path = tempfile.mkdtemp()
+        for run in ["first", "second"]:
+            opt = HyperOpt("bayes",
+                           objective_fn=f,
+                           param_space=[Real(low=0.0, high=1.0, name='x')],
+                           n_calls=12,
+                           warm_start=True,
+                           opt_path=os.path.join(path, run),
+                           verbosity=0
+                           )
+            sr = opt.fit()
+        assert len(sr.func_vals) == 24
+        return
+
+    def test_bayes_parallel(self):
+        def f(**kwargs):
+            return (kwargs['x'] - 0.3) ** 2
+
+        opt = HyperOpt("bayes",
+                       objective_fn=f,
+                       param_space=[Real(low=0.0, high=1.0, name='x')],
+                       n_calls=12,
+                       n_jobs=2,
+                       verbosity=0
+                       )
+        sr = opt.fit()
+        assert len(sr.func_vals) == 12
+        return
+
     def test_hyperopt_basic(self):
         # https://github.com/hyperopt/hyperopt/blob/master/tutorial/01.BasicTutorial.ipynb
         def objective(x):
@@ -493,5 +659,41 @@ class TestAddPrevResult(unittest.TestCase):
         return
 
 
+@unittest.skipIf(hpo_main.orjson is None, "orjson is not installed")
+class TestDumpTrials(unittest.TestCase):
+
+    def dump(self, trials, use_orjson: bool):
+        fname = os.path.join(tempfile.mkdtemp(), 'trials.json')
+        _orjson = hpo_main.orjson
+        if not use_orjson:
+            hpo_main.orjson = None
+        try:
+            hpo_main._dump_trials(trials, fname)
+        finally:
+            hpo_main.orjson = _orjson
+        with open(fname, 'r') as fp:
+            return fp.read()
+
+    def test_same_as_json(self):
+        trials = [{'tid': i,
+                   'result': {'loss': np.float32(i / 3), 'status': STATUS_OK},
+                   'misc': {'vals': {'x': [i / 7], 'c': ['é']}, 'idxs': {'x': [i]}},
+                   'book_time': datetime.datetime(2022, 1, 2, 3, 4, 5, 678000),
+                   'spec': None,
+                   'exp_key': None} for i in range(3)]
+
+        text = self.dump(trials, True)
+        assert text == self.dump(trials, False)
+        assert json.loads(text)[1]['misc']['vals']['c'] == ['é']
+        return
+
+    def test_nan(self):
+        trials = [{'tid': 0, 'result': {'loss': float('nan'), 'status': STATUS_OK}}]
+        # json writes NaN while orjson writes null
+        assert json.loads(self.dump(trials, False))[0]['result']['loss'] != 0.0
+        assert json.loads(self.dump(trials, True))[0]['result']['loss'] is None
+        return
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -8,6 +8,7 @@ import site
 ai4_dir = os.path.dirname(os.path.dirname(os.path.abspath(sys.argv[0])))
 site.addsitedir(ai4_dir)
 
+import numpy as np
 import pandas as pd
 import tensorflow as tf
 
@@ -22,6 +23,11 @@ from ai4water.datasets import busan_beach
 from ai4water.datasets import MtropicsLaos
 from ai4water.postprocessing.explain import LimeExplainer, explain_model_with_lime
 
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
 laos = MtropicsLaos()
 
 reg_data = laos.make_regression(input_features=['air_temp', 'rel_hum'])
@@ -169,6 +175,13 @@ class TestLimeExplainer(unittest.TestCase):
 
         return
 
+    def test_all_examples_parallel(self):
+        lime_exp = get_lime(examples_to_explain=5)
+        lime_exp.explain_all_examples(n_jobs=2)
+        assert len(lime_exp.explaination_objects) == 5
+
+        return
+
     def test_single_example(self):
 
         lime_exp = get_lime()
@@ -177,6 +190,73 @@ class TestLimeExplainer(unittest.TestCase):
 
         return
 
+    def test_lhs_sampling(self):
+        model = make_reg_model()
+        train_x, test_x = get_data(model, to_dataframe=False, examples_to_explain=2)
+
+        lime_exp = LimeExplainer(model=model,
+                                 train_data=train_x,
+                                 data=test_x,
+                                 mode="regression",
+                                 feature_names=list(model.input_features),
+                                 path=model.path,
+                                 verbosity=False,
+                                 save=False,
+                                 show=False,
+                                 sampling="lhs",
+                                 )
+        lime_exp.explain_all_examples(num_samples=200)
+        assert len(lime_exp.explaination_objects) == 2
+
+        return
+
+    def test_new_figure_per_example(self):
+        lime_exp = get_lime()
+        fig0 = lime_exp.explain_example(0)
+        fig1 = lime_exp.explain_example(1)
+        assert fig0 is not fig1
+        assert fig0.axes[0].get_title() == "Local explanation for example 0"
+        return
+
+    def test_return_array(self):
+        lime_exp = get_lime()
+        img = lime_exp.explain_example(0, return_array=True)
+        assert isinstance(img, np.ndarray)
+        assert img.ndim == 3 and img.shape[-1] == 4
+        return
+
+    @unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+    def test_sink_parquet(self):
+        lime_exp = get_lime(examples_to_explain=3)
+        lime_exp.explain_all_examples(sink="parquet", name="weights")
+        df = pd.read_parquet(os.path.join(lime_exp.path, "weights.parquet"))
+        assert df.columns.tolist() == ["instance_index", "feature", "weight"]
+        assert sorted(df["instance_index"].unique()) == [0, 1, 2]
+        assert len(lime_exp.explaination_objects) == 3
+        return
+
+    def test_lightweight(self):
+        model = make_reg_model()
+        train_x, test_x = get_data(model, to_dataframe=False, examples_to_explain=3)
+
+        lime_exp = LimeExplainer(model=model,
+                                 train_data=train_x,
+                                 data=test_x,
+                                 mode="regression",
+                                 feature_names=list(model.input_features),
+                                 path=model.path,
+                                 verbosity=False,
+                                 save=False,
+                                 show=False,
+                                 lightweight=True,
+                                 )
+        lime_exp.explain_all_examples()
+        assert len(lime_exp.explaination_objects) == 0
+        assert lime_exp.weights.shape == (3, len(model.input_features))
+        assert not np.isnan(lime_exp.weights).any()
+
+        return
+
     def test_save_as_html(self):
 
         lime_exp = get_lime()
@@ -239,6 +319,15 @@ class TestLimeExplainer(unittest.TestCase):
         explainer.explain_example(0, colors=([0.9375    , 0.01171875, 0.33203125],
                                              [0.23828125, 0.53515625, 0.92578125]))
 
+    def test_all_examples_colors_annotate(self):
+        # colors and annotate are for the plots and not for explain_instance
+        explainer = get_lime(examples_to_explain=2)
+        explainer.explain_all_examples(colors=("red", "blue"), annotate=True)
+        explainer.save = True
+        explainer.explain_all_examples(colors="green", annotate=True)
+        assert len(explainer.explaination_objects) == 2
+        return
+
     def test_lstm_model(self):
         m = make_lstm_reg_model()
 
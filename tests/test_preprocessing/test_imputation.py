@@ -135,6 +135,15 @@ class TestPandasSKLearn(unittest.TestCase):
 
         return
 
+    def test_no_missing(self):
+        """Test that data without missing values is returned as it is"""
+        orig_df = get_df_with_nans(frac=0.0)
+        imputer = Imputation(data=orig_df, method='KNNImputer')
+        imputed_df = imputer()
+        assert imputed_df.equals(orig_df)
+
+        return
+
 if __name__ == "__main__":
 
     unittest.main()
\ No newline at end of file